@@ -81,7 +81,7 @@ st.markdown("Find the right healthcare provider for your client — quickly and
 
 # Load data once - this is cached by @st.cache_data in load_application_data
 try:
-    provider_df, detailed_referrals_df = load_application_data()
+    provider_df, detailed_referrals_df, _ = load_application_data()
 except Exception as e:
     st.error("❌ Failed to load provider data. Please ensure data files are available or contact support.")
     st.info(f"**Error Type:** {type(e).__name__}")
@@ -25,7 +25,7 @@ def calculate_referral_counts(provider_df: pd.DataFrame, detailed_df: pd.DataFra
     """Calculate referral counts if missing from provider data."""
     if not detailed_df.empty and "Full Name" in detailed_df.columns:
         referral_counts = detailed_df.groupby("Full Name").size().reset_index(name="Referral Count")
-        provider_df = provider_df.merge(referral_counts, on="Full Name", how="left")
+        provider_df = provider_df.merge(referral_counts, on="Full Name", how="left", validate="many_to_one")
         provider_df["Referral Count"] = provider_df["Referral Count"].fillna(0)
     else:
         provider_df["Referral Count"] = 0
@@ -158,13 +158,16 @@ def display_data_quality_dashboard() -> None:
             "Preferred Providers": processed_dir / "cleaned_preferred_providers.parquet",
         }
 
-        file_info = []
-        for name, path in parquet_files.items():
-            if path.exists():
-                import os
+        # Fetch size and modification time for all files in one metadata call
+        import pyarrow.fs as pafs
+
+        infos = pafs.LocalFileSystem().get_file_info([str(path) for path in parquet_files.values()])
 
-                size_mb = os.path.getsize(path) / (1024 * 1024)
-                modified = datetime.fromtimestamp(os.path.getmtime(path))
+        file_info = []
+        for name, info in zip(parquet_files, infos):
+            if info.type == pafs.FileType.File:
+                size_mb = info.size / (1024 * 1024)
+                modified = datetime.fromtimestamp(info.mtime_ns / 1e9)
                 file_info.append(
                     {
                         "Dataset": name,
@@ -284,9 +287,9 @@ def display_data_quality_dashboard() -> None:
                     )
 
         # Show S3 sync status if configured
-        from src.utils.s3_client_optimized import S3DataClient
+        from src.utils.s3_client_optimized import get_optimized_s3_client
 
-        s3_client = S3DataClient()
+        s3_client = get_optimized_s3_client()
         if s3_client.is_configured():
             st.markdown("### 📥 S3 Sync Status")
             st.success("✅ AWS S3 is configured and available for data pulls")
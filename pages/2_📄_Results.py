@@ -2,7 +2,7 @@ import pandas as pd
 import streamlit as st
 
 from src.app_logic import apply_time_filtering, load_application_data, run_recommendation, validate_provider_data
-from src.utils.io_utils import format_phone_number, get_word_bytes, sanitize_filename
+from src.utils.io_utils import format_phone_number, format_phone_series, get_word_bytes, sanitize_filename
 from src.utils.responsive import resp_columns
 from src.utils.freshness import format_last_verified_display
 
@@ -31,7 +31,7 @@ if any(k not in st.session_state for k in required_keys):
     st.switch_page("pages/1_🔎_Search.py")
 
 try:
-    provider_df, detailed_referrals_df = load_application_data()
+    provider_df, detailed_referrals_df, inbound_referrals_df = load_application_data()
 except Exception as e:
     st.error("❌ Failed to load provider data. Please return to the search page and try again.")
     st.info(f"Technical details: {str(e)}")
@@ -46,6 +46,9 @@ if provider_df.empty:
         st.switch_page("pages/1_🔎_Search.py")
     st.stop()
 
+# Recommendations are cached on the loaded data version plus the time filter bounds
+data_version = provider_df.attrs.get("data_version")
+time_bounds = None
 if (
     st.session_state.get("use_time_filter")
     and isinstance(st.session_state.get("time_period"), list)
@@ -53,7 +56,10 @@ if (
 ):
     start_date, end_date = st.session_state["time_period"]
     try:
-        provider_df = apply_time_filtering(provider_df, detailed_referrals_df, start_date, end_date)
+        provider_df = apply_time_filtering(
+            provider_df, detailed_referrals_df, inbound_referrals_df, start_date, end_date
+        )
+        time_bounds = (str(start_date), str(end_date))
     except Exception as e:
         st.warning(f"⚠️ Failed to apply time filtering. Using all available data. Details: {str(e)}")
 
@@ -79,6 +85,7 @@ if best is None or scored_df is None or (isinstance(scored_df, pd.DataFrame) and
             # Prefer normalized preferred weight when available (preferred_norm); fall back to preferred_weight
             preferred_weight=st.session_state.get("preferred_norm", st.session_state.get("preferred_weight", 0.1)),
             selected_specialties=st.session_state.get("selected_specialties"),
+            data_key=(data_version, time_bounds) if data_version is not None else None,
         )
         st.session_state["last_best"] = best
         st.session_state["last_scored_df"] = scored_df
@@ -202,7 +209,7 @@ if available:
     phone_fields = ["Work Phone Number", "Work Phone", "Phone Number", "Phone 1"]
     for phone_field in phone_fields:
         if phone_field in display_df.columns:
-            display_df[phone_field] = display_df[phone_field].apply(format_phone_number)
+            display_df[phone_field] = format_phone_series(display_df[phone_field])
 
     # Format Last Verified Date with freshness indicator
     if "Last Verified Date" in display_df.columns:
@@ -6,6 +6,7 @@ from src.data import process_referral_data, process_preferred_providers, refresh
 from src.data.ingestion import DataIngestionManager, DataSource
 from src.utils.s3_client_optimized import (
     S3DataClient,
+    get_optimized_s3_client,
     get_s3_files_optimized,
 )
 
@@ -57,7 +58,7 @@ st.markdown("---")
 st.markdown("**Technical Details**")
 
 # Check S3 configuration
-s3_client = S3DataClient()
+s3_client = get_optimized_s3_client()
 s3_enabled = s3_client.is_configured()
 
 # default effective folder map (may be overridden by session state when s3 is enabled)
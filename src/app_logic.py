@@ -1,8 +1,17 @@
+import hashlib
+import logging
+import os
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Optional
+
+import numpy as np
 import pandas as pd
 import streamlit as st
 
-from src.data.ingestion import load_detailed_referrals, load_inbound_referrals
+from src.data.ingestion import get_data_version, load_detailed_referrals, load_inbound_referrals
 from src.utils.cleaning import (
+    MISSING_TEXT,
     build_full_address,
     clean_address_data,
     validate_and_clean_coordinates,
@@ -13,7 +22,12 @@ from src.utils.providers import (
     calculate_time_based_referral_counts,
     load_and_validate_provider_data,
 )
-from src.utils.scoring import calculate_distances, recommend_provider
+from src.utils.scoring import (
+    add_coordinate_trig_columns,
+    haversine_miles,
+    haversine_miles_from_radians,
+    recommend_provider,
+)
 
 __all__ = [
     "load_application_data",
@@ -26,9 +40,26 @@ __all__ = [
 ]
 
 
+logger = logging.getLogger(__name__)
+
 # Flag to ensure preferred percentage warning is logged only once per app session
 _preferred_pct_warning_logged = False
 
+# Low-cardinality text columns stored as pandas categoricals once loading is done.
+# Full Name and Full Address are (near) unique per provider, so they stay as strings.
+_CATEGORY_COLUMNS = ("Specialty", "City", "State")
+
+# On-disk copy of the enriched provider table, keyed by the local parquet inputs it was
+# built from. Bump the version when the enrichment pipeline changes its output.
+_ENRICHED_CACHE_DIR = Path("data/cache")
+_ENRICHED_CACHE_VERSION = "1"
+_ENRICHED_CACHE_KEEP = 3
+_ENRICHED_CACHE_SOURCES = (
+    Path("data/processed/cleaned_outbound_referrals.parquet"),
+    Path("data/processed/cleaned_inbound_referrals.parquet"),
+    Path("data/processed/cleaned_preferred_providers.parquet"),
+)
+
 
 @st.cache_data(ttl=3600)
 def load_application_data():
@@ -41,17 +72,49 @@ def load_application_data():
     4. Preferred provider list integration
 
     Returns:
-        Tuple[pd.DataFrame, pd.DataFrame]: (provider_df, detailed_referrals_df)
+        Tuple[pd.DataFrame, pd.DataFrame, pd.DataFrame]:
+            (provider_df, detailed_referrals_df, inbound_referrals_df)
             - provider_df: Complete provider data with all enrichments
             - detailed_referrals_df: Detailed outbound referral records
+            - inbound_referrals_df: Detailed inbound referral records
+
+    When running from local parquet files (no S3), the enriched provider table is also
+    written to ``data/cache`` so a cold restart can skip the enrichment pipeline.
+
+    The source versions the data was loaded from are stored in
+    ``provider_df.attrs["data_version"]`` for use as a run_recommendation data key.
 
     Raises:
         Exception: If data loading fails completely (caught by calling code)
     """
-    import logging
-
-    logger = logging.getLogger(__name__)
-
+    # Read the versions first so a concurrent upload yields a stale key, never a stale frame
+    data_version = get_data_version()
+
+    # The two referral loads are independent (cache lookups, snapshot reads, or a shared
+    # parse of the S3 file), so run them concurrently rather than back to back
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        detailed_future = executor.submit(load_detailed_referrals)
+        inbound_future = executor.submit(load_inbound_referrals)
+        detailed_referrals_df = detailed_future.result()
+        inbound_referrals_df = inbound_future.result()
+
+    cache_path = _enriched_cache_path()
+    provider_df = _read_enriched_cache(cache_path)
+    if provider_df is None:
+        provider_df = _build_provider_table(inbound_referrals_df)
+        _write_enriched_cache(cache_path, provider_df)
+
+    # Split specialties once so the specialty list and filter reuse the sets. Frozensets
+    # do not round-trip through parquet, so this happens after the disk cache.
+    if "Specialty" in provider_df.columns:
+        provider_df["_specialty_set"] = provider_df["Specialty"].astype(object).map(_split_specialties)
+
+    provider_df.attrs["data_version"] = data_version
+    return provider_df, detailed_referrals_df, inbound_referrals_df
+
+
+def _build_provider_table(inbound_referrals_df: pd.DataFrame) -> pd.DataFrame:
+    """Run the provider enrichment pipeline behind load_application_data."""
     provider_df = load_and_validate_provider_data()
 
     if provider_df.empty:
@@ -69,29 +132,27 @@ def load_application_data():
     if not provider_df.empty:
         provider_df = validate_and_clean_coordinates(provider_df)
         provider_df = clean_address_data(provider_df)
-        for col in ["Street", "City", "State", "Zip", "Full Address"]:
-            if col in provider_df.columns:
-                provider_df[col] = provider_df[col].astype(str).replace(["nan", "None", "NaN"], "").fillna("")
+        address_cols = [c for c in ("Street", "City", "State", "Zip", "Full Address") if c in provider_df.columns]
+        if address_cols:
+            address_text = provider_df[address_cols].astype(str)
+            provider_df[address_cols] = address_text.mask(address_text.isna() | address_text.isin(MISSING_TEXT), "")
         if "Full Address" not in provider_df.columns or provider_df["Full Address"].isna().any():
             provider_df = build_full_address(provider_df)
         if "Full Name" in provider_df.columns:
-            provider_df = provider_df.drop_duplicates(subset=["Full Name"], keep="first")
+            provider_df = _index_by_name(provider_df.drop_duplicates(subset=["Full Name"], keep="first"))
         phone_candidates = [
             col for col in ["Work Phone Number", "Work Phone", "Phone Number", "Phone 1"] if col in provider_df.columns
         ]
         if phone_candidates:
-            from src.utils.io_utils import format_phone_number
+            from src.utils.io_utils import format_phone_series
 
             phone_source = phone_candidates[0]
-            provider_df["Work Phone Number"] = provider_df[phone_source].apply(format_phone_number)
+            provider_df["Work Phone Number"] = format_phone_series(provider_df[phone_source])
             if "Work Phone" not in provider_df.columns:
                 provider_df["Work Phone"] = provider_df["Work Phone Number"]
             if "Phone Number" not in provider_df.columns:
                 provider_df["Phone Number"] = provider_df["Work Phone Number"]
 
-    detailed_referrals_df = load_detailed_referrals()
-    inbound_referrals_df = load_inbound_referrals()
-
     if not provider_df.empty:
         if not inbound_referrals_df.empty:
             inbound_counts_df = calculate_inbound_referral_counts(inbound_referrals_df)
@@ -100,11 +161,10 @@ def load_application_data():
                 and "Full Name" in provider_df.columns
                 and "Full Name" in inbound_counts_df.columns
             ):
-                provider_df = provider_df.merge(
-                    inbound_counts_df[["Full Name", "Inbound Referral Count"]],
-                    on="Full Name",
-                    how="left",
-                )
+                # Counts are grouped by name plus contact columns; collapse to one row per
+                # provider so the merge cannot fan out provider rows.
+                inbound_totals = inbound_counts_df.groupby("Full Name")[["Inbound Referral Count"]].sum()
+                provider_df = provider_df.join(inbound_totals, how="left", validate="one_to_one")
                 provider_df["Inbound Referral Count"] = provider_df["Inbound Referral Count"].fillna(0)
             else:
                 provider_df["Inbound Referral Count"] = 0
@@ -124,14 +184,8 @@ def load_application_data():
             logger.info(f"Loaded {len(pref_data)} unique preferred providers from preferred providers file")
             logger.debug(f"Preferred providers: {pref_data['Full Name'].tolist()[:10]}...")  # Show first 10
 
-            # Merge outer so preferred-only providers are included
-            provider_df = provider_df.merge(
-                pref_data, on="Full Name", how="outer", indicator=True, suffixes=("", "_pref")
-            )
-            # Mark preferred where the merge shows presence in preferred list (boolean)
-            provider_df["Preferred Provider"] = provider_df["_merge"].apply(
-                lambda v: True if v in ("both", "right_only") else False
-            )
+            # Include preferred-only providers and flag everyone on the preferred list
+            provider_df = _merge_preferred_providers(provider_df, pref_data)
 
             # Count and log preferred provider attribution
             preferred_count = provider_df["Preferred Provider"].sum()
@@ -153,13 +207,6 @@ def load_application_data():
                     )
                     _preferred_pct_warning_logged = True  # Set flag to prevent future duplicate warnings
 
-            provider_df = provider_df.drop(columns=["_merge"])
-
-            # If Specialty column exists from preferred providers, use it
-            # (prioritize preferred provider specialty)
-            if "Specialty_pref" in provider_df.columns:
-                provider_df["Specialty"] = provider_df["Specialty_pref"]
-                provider_df = provider_df.drop(columns=["Specialty_pref"])
         else:
             # No preferred list available or no Full Name column
             # Ensure the column exists as boolean; default to False when missing
@@ -173,22 +220,142 @@ def load_application_data():
 
     # Ensure referral counts are numeric and fill missing with zero (important when preferred list added new rows)
     if "Referral Count" in provider_df.columns:
-        provider_df["Referral Count"] = pd.to_numeric(provider_df["Referral Count"], errors="coerce").fillna(0)
+        provider_df["Referral Count"] = _numeric_counts(provider_df["Referral Count"])
     else:
         provider_df["Referral Count"] = 0
 
     # Ensure inbound referral count exists
     if "Inbound Referral Count" in provider_df.columns:
-        provider_df["Inbound Referral Count"] = pd.to_numeric(
-            provider_df["Inbound Referral Count"], errors="coerce"
-        ).fillna(0)
+        provider_df["Inbound Referral Count"] = _numeric_counts(provider_df["Inbound Referral Count"])
     else:
         provider_df["Inbound Referral Count"] = 0
 
-    return provider_df, detailed_referrals_df
+    if {"Latitude", "Longitude"}.issubset(provider_df.columns):
+        provider_df = add_coordinate_trig_columns(provider_df)
+
+    for col in _CATEGORY_COLUMNS:
+        if col in provider_df.columns:
+            provider_df[col] = provider_df[col].astype("category")
+
+    # Preferred-only rows were appended with a fresh index; re-key everything by name
+    if "Full Name" in provider_df.columns:
+        provider_df = _index_by_name(provider_df)
+
+    return provider_df
+
+
+def _numeric_counts(counts: pd.Series) -> pd.Series:
+    """Counts as numbers with missing values as 0, skipping conversions the column does not need."""
+    if not pd.api.types.is_numeric_dtype(counts):
+        counts = pd.to_numeric(counts, errors="coerce")
+    return counts.fillna(0) if counts.isna().any() else counts
+
+
+def _enriched_cache_path() -> Optional[Path]:
+    """Disk cache file for the current local parquet inputs, or None when not applicable.
+
+    The key hashes the name, size, and modification time of each input file (including
+    snapshots of processed S3 data), so
+    regenerating any of them (e.g. via the Update Data page) selects a new file.
+    S3-backed deployments always rebuild, since their inputs are not local files.
+    """
+    from src.utils.config import is_api_enabled
+
+    if is_api_enabled("s3"):
+        return None
+
+    digest = hashlib.blake2b(_ENRICHED_CACHE_VERSION.encode(), digest_size=16)
+    found = False
+    # Snapshots of processed S3 data take precedence over the cleaned files when loading
+    snapshots = sorted(_ENRICHED_CACHE_SOURCES[0].parent.glob("s3_*.parquet"))
+    for source in (*_ENRICHED_CACHE_SOURCES, *snapshots):
+        try:
+            stat = source.stat()
+        except OSError:
+            digest.update(f"{source.name}:missing;".encode())
+            continue
+        found = True
+        digest.update(f"{source.name}:{stat.st_size}:{stat.st_mtime_ns};".encode())
+
+    if not found:
+        return None
+    return _ENRICHED_CACHE_DIR / f"provider_enriched_{digest.hexdigest()}.parquet"
+
+
+def _read_enriched_cache(cache_path: Optional[Path]) -> Optional[pd.DataFrame]:
+    """Load the enriched provider table from disk, or None on a miss."""
+    if cache_path is None or not cache_path.exists():
+        return None
+    try:
+        provider_df = pd.read_parquet(cache_path)
+    except Exception as e:
+        logger.warning(f"Ignoring unreadable provider cache {cache_path}: {e}")
+        return None
+    logger.info(f"Loaded {len(provider_df)} providers from disk cache {cache_path}")
+    return provider_df
+
+
+def _write_enriched_cache(cache_path: Optional[Path], provider_df: pd.DataFrame) -> None:
+    """Write the enriched provider table to disk and keep only the newest few cache files."""
+    if cache_path is None or provider_df.empty:
+        return
+    tmp_path = cache_path.with_name(cache_path.name + ".tmp")
+    try:
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+        provider_df.to_parquet(tmp_path)
+        os.replace(tmp_path, cache_path)
+    except Exception as e:
+        logger.warning(f"Could not write provider cache {cache_path}: {e}")
+        return
+
+    stale = sorted(
+        cache_path.parent.glob("provider_enriched_*.parquet"), key=lambda p: p.stat().st_mtime, reverse=True
+    )
+    for old_path in stale[_ENRICHED_CACHE_KEEP:]:
+        try:
+            old_path.unlink()
+        except OSError:
+            pass
+
+
+def _index_by_name(provider_df: pd.DataFrame) -> pd.DataFrame:
+    """Index providers by their "Full Name" values while keeping the column.
+
+    Name-indexed frames let per-provider lookups (joins, reindex) reuse the
+    index hash table. The index is left unnamed so "Full Name" stays an
+    unambiguous column label for sort_values/groupby.
+    """
+    return provider_df.set_index("Full Name", drop=False).rename_axis(index=None)
+
+
+def _merge_preferred_providers(provider_df: pd.DataFrame, pref_data: pd.DataFrame) -> pd.DataFrame:
+    """Append preferred-only providers and flag everyone on the preferred list.
+
+    Args:
+        provider_df: Provider DataFrame, unique by "Full Name"
+        pref_data: Preferred providers ("Full Name" and optional "Specialty"), unique by "Full Name"
+
+    Returns:
+        pd.DataFrame: Providers plus preferred-only rows, with a boolean "Preferred Provider"
+        column. Preferred specialties take priority over existing ones.
+    """
+    existing_names = provider_df["Full Name"] if "Full Name" in provider_df.columns else pd.Series(dtype=object)
+    preferred_only = pref_data[~pref_data["Full Name"].isin(existing_names)]
+    if not preferred_only.empty:
+        provider_df = pd.concat([provider_df, preferred_only], ignore_index=True)
+
+    provider_df["Preferred Provider"] = provider_df["Full Name"].isin(pref_data["Full Name"])
+
+    if "Specialty" in pref_data.columns:
+        pref_specialty = provider_df["Full Name"].map(pref_data.set_index("Full Name")["Specialty"])
+        if "Specialty" in provider_df.columns:
+            pref_specialty = pref_specialty.combine_first(provider_df["Specialty"])
+        provider_df["Specialty"] = pref_specialty
 
+    return provider_df
 
-def apply_time_filtering(provider_df, detailed_referrals_df, start_date, end_date):
+
+def apply_time_filtering(provider_df, detailed_referrals_df, inbound_referrals_df, start_date, end_date):
     """Apply time-based filtering for outbound and inbound referrals.
 
     Recalculates referral counts based on a specific date range, replacing
@@ -197,6 +364,8 @@ def apply_time_filtering(provider_df, detailed_referrals_df, start_date, end_dat
     Args:
         provider_df: Provider DataFrame with existing referral counts
         detailed_referrals_df: Detailed outbound referral records
+        inbound_referrals_df: Detailed inbound referral records, as returned by
+            load_application_data (passed in so slider changes don't reload it)
         start_date: Start date for filtering (inclusive)
         end_date: End date for filtering (inclusive)
 
@@ -207,22 +376,29 @@ def apply_time_filtering(provider_df, detailed_referrals_df, start_date, end_dat
     if not detailed_referrals_df.empty:
         time_filtered_outbound = calculate_time_based_referral_counts(detailed_referrals_df, start_date, end_date)
         if not time_filtered_outbound.empty:
-            working_df = working_df.drop(columns=["Referral Count"], errors="ignore").merge(
-                time_filtered_outbound[["Full Name", "Referral Count"]], on="Full Name", how="left"
-            )
-            working_df["Referral Count"] = working_df["Referral Count"].fillna(0)
+            working_df["Referral Count"] = _lookup_counts(working_df, time_filtered_outbound, "Referral Count")
 
-    inbound_referrals_df = load_inbound_referrals()
-    if not inbound_referrals_df.empty:
+    if inbound_referrals_df is not None and not inbound_referrals_df.empty:
         time_filtered_inbound = calculate_inbound_referral_counts(inbound_referrals_df, start_date, end_date)
         if not time_filtered_inbound.empty:
-            working_df = working_df.drop(columns=["Inbound Referral Count"], errors="ignore").merge(
-                time_filtered_inbound[["Full Name", "Inbound Referral Count"]], on="Full Name", how="left"
+            working_df["Inbound Referral Count"] = _lookup_counts(
+                working_df, time_filtered_inbound, "Inbound Referral Count"
             )
-            working_df["Inbound Referral Count"] = working_df["Inbound Referral Count"].fillna(0)
     return working_df
 
 
+def _lookup_counts(provider_df: pd.DataFrame, counts_df: pd.DataFrame, count_col: str) -> pd.Series:
+    """Map per-provider counts onto ``provider_df`` by ``Full Name``.
+
+    The count helpers group by name plus contact columns, so a provider can
+    appear on several rows; those are summed into a single ``{Full Name: count}``
+    lookup and applied with a hashed ``map`` instead of a merge. Providers with
+    no referrals in the window get 0.
+    """
+    mapping = counts_df.groupby("Full Name")[count_col].sum().to_dict()
+    return provider_df["Full Name"].map(mapping).fillna(0)
+
+
 def filter_providers_by_radius(df: pd.DataFrame, max_radius_miles: float) -> pd.DataFrame:
     """Filter providers by maximum radius distance.
 
@@ -231,11 +407,12 @@ def filter_providers_by_radius(df: pd.DataFrame, max_radius_miles: float) -> pd.
         max_radius_miles: Maximum distance threshold in miles
 
     Returns:
-        pd.DataFrame: Filtered DataFrame with only providers within radius
+        pd.DataFrame: Filtered DataFrame with only providers within radius. No defensive
+        copy is made; callers that mutate the result should copy it themselves.
     """
     if df is None or df.empty or "Distance (Miles)" not in df.columns:
         return df
-    return df[df["Distance (Miles)"] <= max_radius_miles].copy()
+    return df[df["Distance (Miles)"] <= max_radius_miles]
 
 
 def get_unique_specialties(provider_df: pd.DataFrame) -> list[str]:
@@ -252,21 +429,7 @@ def get_unique_specialties(provider_df: pd.DataFrame) -> list[str]:
     if provider_df.empty or "Specialty" not in provider_df.columns:
         return []
 
-    # Get all non-null specialty values
-    specialties_series = provider_df["Specialty"].dropna()
-
-    if specialties_series.empty:
-        return []
-
-    # Split comma-separated specialties and collect unique values
-    unique_specialties = set()
-    for specialty_str in specialties_series:
-        if pd.notna(specialty_str) and str(specialty_str).strip():
-            # Split by comma and strip whitespace from each specialty
-            parts = [s.strip() for s in str(specialty_str).split(",")]
-            unique_specialties.update(part for part in parts if part)
-
-    return sorted(list(unique_specialties))
+    return sorted(frozenset().union(*_specialty_sets(provider_df)))
 
 
 def filter_providers_by_specialty(df: pd.DataFrame, selected_specialties: list[str]) -> pd.DataFrame:
@@ -289,19 +452,27 @@ def filter_providers_by_specialty(df: pd.DataFrame, selected_specialties: list[s
     if not selected_specialties or "Specialty" not in df.columns:
         return df
 
-    # Create a boolean mask for providers that match any selected specialty
-    def matches_specialty(specialty_value):
-        if pd.isna(specialty_value):
-            return False
+    return df[_specialty_mask(df, selected_specialties)].copy()
+
 
-        # Split comma-separated specialties
-        provider_specialties = [s.strip() for s in str(specialty_value).split(",")]
+def _specialty_mask(df: pd.DataFrame, selected_specialties) -> pd.Series:
+    """Boolean mask of providers with ANY of their comma-separated specialties selected."""
+    selected = frozenset(selected_specialties)
+    return ~_specialty_sets(df).map(selected.isdisjoint).astype(bool)
 
-        # Check if any provider specialty matches any selected specialty
-        return any(ps in selected_specialties for ps in provider_specialties if ps)
 
-    mask = df["Specialty"].apply(matches_specialty)
-    return df[mask].copy()
+def _split_specialties(specialty_value) -> frozenset:
+    """Comma-separated specialty string as a set of stripped, non-empty names."""
+    if pd.isna(specialty_value):
+        return frozenset()
+    return frozenset(part for part in (s.strip() for s in str(specialty_value).split(",")) if part)
+
+
+def _specialty_sets(df: pd.DataFrame) -> pd.Series:
+    """Per-provider specialty sets, reusing the _specialty_set column from load_application_data."""
+    if "_specialty_set" in df.columns:
+        return df["_specialty_set"]
+    return df["Specialty"].astype(object).map(_split_specialties)
 
 
 def run_recommendation(
@@ -316,16 +487,16 @@ def run_recommendation(
     gamma: float,
     preferred_weight: float = 0.1,
     selected_specialties: list[str] = None,
+    data_key: Optional[tuple] = None,
 ):
     """Run the complete provider recommendation workflow.
 
     This orchestrates the core recommendation algorithm:
-    1. Filter by specialty (if specified)
-    2. Filter by minimum referral threshold
-    3. Calculate distances from client location
-    4. Filter by maximum radius
-    5. Score providers using weighted criteria
-    6. Return best match and ranked results
+    1. Calculate distances from client location
+    2. Filter by specialty (if specified), minimum referral threshold, and
+       maximum radius in a single combined mask
+    3. Score providers using weighted criteria
+    4. Return best match and ranked results
 
     Args:
         provider_df: Provider data with referral counts
@@ -338,32 +509,93 @@ def run_recommendation(
         gamma: Normalized weight for inbound referrals (0-1)
         preferred_weight: Normalized weight for preferred status (0-1)
         selected_specialties: Optional list of specialties to filter by
+        data_key: Hashable identity of provider_df, e.g. its data version plus the
+            time filter bounds. Results are cached under this key; without one the
+            workflow runs uncached.
 
     Returns:
         Tuple[Optional[pd.Series], pd.DataFrame]:
             - best: Top-ranked provider (or None if no matches)
             - scored_df: All matching providers with scores (or empty DataFrame)
     """
-    working = provider_df.copy()
+    args = (
+        user_lat,
+        user_lon,
+        min_referrals,
+        max_radius_miles,
+        alpha,
+        beta,
+        gamma,
+        preferred_weight,
+        tuple(selected_specialties or ()),
+    )
+    if data_key is None:
+        return _recommend(provider_df, *args)
+    return _run_recommendation_cached(provider_df, data_key, *args)
 
-    # Apply specialty filter first (before other filters)
-    if selected_specialties:
-        working = filter_providers_by_specialty(working, selected_specialties)
-        if working.empty:
-            return None, pd.DataFrame()
 
-    # Apply referral count filter
-    working = working[working["Referral Count"] >= min_referrals].copy()
-    if working.empty:
-        return None, pd.DataFrame()
+@st.cache_data(ttl=600, show_spinner=False, max_entries=64)
+def _run_recommendation_cached(
+    _provider_df: pd.DataFrame,
+    data_key: tuple,
+    user_lat: float,
+    user_lon: float,
+    min_referrals: int,
+    max_radius_miles: int,
+    alpha: float,
+    beta: float,
+    gamma: float,
+    preferred_weight: float,
+    selected_specialties: tuple[str, ...],
+):
+    """Cached run_recommendation, keyed on data_key rather than hashing the provider table.
 
-    # Calculate distances and filter by radius
-    working["Distance (Miles)"] = calculate_distances(user_lat, user_lon, working)
-    working = filter_providers_by_radius(working, max_radius_miles)
-    if working.empty:
+    Re-running a search with the same data, location, weights, and filters is served
+    from the cache without Streamlit hashing every row of _provider_df. Every distinct
+    search keeps its own result frame, so the cache is capped at 64 entries.
+    """
+    return _recommend(
+        _provider_df,
+        user_lat,
+        user_lon,
+        min_referrals,
+        max_radius_miles,
+        alpha,
+        beta,
+        gamma,
+        preferred_weight,
+        selected_specialties,
+    )
+
+
+def _recommend(
+    provider_df: pd.DataFrame,
+    user_lat: float,
+    user_lon: float,
+    min_referrals: int,
+    max_radius_miles: int,
+    alpha: float,
+    beta: float,
+    gamma: float,
+    preferred_weight: float,
+    selected_specialties: tuple[str, ...],
+):
+    """Body of run_recommendation: filter, score, and rank providers."""
+    # Build one combined mask over plain arrays (referral threshold, radius, specialty)
+    # and slice the provider table once, instead of filtering and re-slicing per criterion.
+    distances = _provider_distances(provider_df, user_lat, user_lon)
+    referrals = provider_df["Referral Count"].to_numpy(dtype=float, na_value=np.nan)
+    mask = (referrals >= min_referrals) & (distances <= max_radius_miles)
+    if selected_specialties and "Specialty" in provider_df.columns:
+        mask &= _specialty_mask(provider_df, selected_specialties).to_numpy()
+    if not mask.any():
         return None, pd.DataFrame()
 
-    # Score and rank providers
+    # The slice is the one copy, since the distance column is added to it
+    working = provider_df[mask].copy()
+    working["Distance (Miles)"] = distances[mask]
+
+    # Score and rank providers (recommend_provider works on its own copy)
     best, scored_df = recommend_provider(
         working,
         distance_weight=alpha,
@@ -375,3 +607,21 @@ def run_recommendation(
     if scored_df is not None and not scored_df.empty and "Full Name" in scored_df.columns:
         scored_df = scored_df.drop_duplicates(subset=["Full Name"], keep="first")
     return best, scored_df
+
+
+def _provider_distances(provider_df: pd.DataFrame, user_lat: float, user_lon: float) -> np.ndarray:
+    """Distances in miles to every provider, reusing trig columns from load_application_data when present."""
+    if {"_lat_rad", "_lon_rad", "_cos_lat"}.issubset(provider_df.columns):
+        return haversine_miles_from_radians(
+            user_lat,
+            user_lon,
+            provider_df["_lat_rad"].to_numpy(),
+            provider_df["_lon_rad"].to_numpy(),
+            provider_df["_cos_lat"].to_numpy(),
+        )
+    return haversine_miles(
+        user_lat,
+        user_lon,
+        provider_df["Latitude"].to_numpy(dtype=float, na_value=np.nan),
+        provider_df["Longitude"].to_numpy(dtype=float, na_value=np.nan),
+    )
@@ -3,6 +3,7 @@
 # Import main data functions for backward compatibility
 from .ingestion import (
     get_data_ingestion_status,
+    get_ingestion_stats,
     load_detailed_referrals,
     load_inbound_referrals,
     load_preferred_providers,
@@ -20,6 +21,7 @@ from .preparation import (
 
 __all__ = [
     "get_data_ingestion_status",
+    "get_ingestion_stats",
     "load_detailed_referrals",
     "load_inbound_referrals",
     "load_provider_data",
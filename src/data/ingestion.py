@@ -12,23 +12,200 @@ Key Features:
 - Centralized error handling and validation
 """
 
+import hashlib
 import logging
+import os
+import re
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from datetime import date, datetime, timedelta
 from enum import Enum
 from pathlib import Path
-from typing import Dict, Optional, Tuple, Union
+from typing import Callable, Dict, Optional, Tuple, Union
 
+import numpy as np
 import pandas as pd
+import pyarrow.parquet as pq
 import streamlit as st
 
+from src.data.io_utils import arrow_string_dtype as _arrow_string_dtype
 from src.data.io_utils import load_dataframe
 from src.data.preparation import process_referral_data
-from src.utils.s3_client_optimized import S3DataClient
+from src.utils import config
+from src.utils.s3_client_optimized import get_optimized_s3_client
 
 logger = logging.getLogger(__name__)
 
 # Flag to ensure preferred providers warnings are logged only once per app session
 _preferred_providers_warning_logged = False
 
+# Columns read from referral parquet files when building PROVIDER_DATA. Parquet is
+# columnar, so projecting to what _process_provider_data aggregates skips the rest.
+_PROVIDER_SOURCE_COLUMNS = [
+    "Full Name",
+    "Project ID",
+    "Work Address",
+    "Work Phone",
+    "Latitude",
+    "Longitude",
+    "Referral Source",
+    "Last Verified Date",
+    "Referral Count",
+]
+
+
+# S3 folders holding the source files; each is listed and downloaded together
+_S3_FOLDER_TYPES = ("referrals", "preferred_providers")
+
+# Raw export columns mapped onto the standardized provider schema, per referral direction
+_OUTBOUND_COLUMN_MAP = {
+    "Referred To Full Name": "Full Name",
+    "Referred To's Work Phone": "Work Phone",
+    "Referred To's Work Address": "Work Address",
+    "Referred To's Details: Latitude": "Latitude",
+    "Referred To's Details: Longitude": "Longitude",
+    "Referred To's Details: Last Verified Date": "Last Verified Date",
+}
+_INBOUND_COLUMN_MAP = {
+    "Referred From Full Name": "Full Name",
+    "Referred From's Work Phone": "Work Phone",
+    "Referred From's Work Address": "Work Address",
+    "Referred From's Details: Latitude": "Latitude",
+    "Referred From's Details: Longitude": "Longitude",
+    "Referred From's Details: Last Verified Date": "Last Verified Date",
+}
+
+# Raw preferred-provider export columns mapped onto the same schema; rows without both
+# geo columns are dropped before renaming
+_PREFERRED_GEO_COLUMNS = ("Contact's Details: Latitude", "Contact's Details: Longitude")
+_PREFERRED_COLUMN_MAP = {
+    "Contact Full Name": "Full Name",
+    "Contact's Work Phone": "Work Phone",
+    "Contact's Work Address": "Work Address",
+    _PREFERRED_GEO_COLUMNS[0]: "Latitude",
+    _PREFERRED_GEO_COLUMNS[1]: "Longitude",
+    "Contact's Details: Specialty": "Specialty",
+    "Contact's Details: Last Verified Date": "Last Verified Date",
+    "Contact's Details: Person ID": "Person ID",
+}
+
+# Key indicators of cleaned data; four or more present marks a frame as already standardized
+_CLEANED_INDICATORS = frozenset({"Full Name", "Work Address", "Work Phone", "Latitude", "Longitude", "referral_type"})
+
+# Date columns in priority order for the unified "Referral Date"
+_REFERRAL_DATE_COLUMNS = ("Create Date", "Date of Intake", "Sign Up Date")
+_MIN_VALID_DATE = pd.Timestamp("1990-01-01")
+_MAX_VALID_DATE = pd.Timestamp("2100-01-01")
+
+# Processed S3 data is snapshotted here so restarts and S3 outages can reuse it
+_PROCESSED_DIR = Path("data/processed")
+_S3_SNAPSHOT_PREFIX = "s3_"
+# Bump when processing changes the snapshot layout so older snapshots are not reused
+_S3_SNAPSHOT_VERSION = "1"
+# Latest snapshot per source, with the (device, inode, mtime) of the directory it was found in
+_snapshot_scans: Dict[str, Tuple[Tuple[int, int, int], Optional[Path]]] = {}
+
+
+def _s3_snapshot_glob(source: "DataSource") -> str:
+    """Filename pattern matching every snapshot of a source's processed S3 data."""
+    return f"{_S3_SNAPSHOT_PREFIX}{source.value}_*.parquet"
+
+
+def _s3_snapshot_path(source: "DataSource", last_modified: str) -> Optional[Path]:
+    """Snapshot path for one S3 object version, or None for content-digest keys.
+
+    Content digests carry no ordering, so those versions are not snapshotted.
+    """
+    if not last_modified or last_modified.startswith("blake2b:"):
+        return None
+    stamp = re.sub(r"[^0-9A-Za-z]", "", last_modified)
+    return _PROCESSED_DIR / f"{_S3_SNAPSHOT_PREFIX}{source.value}_{stamp}_v{_S3_SNAPSHOT_VERSION}.parquet"
+
+
+def _read_parquet(path: Path, columns: Optional[list] = None) -> pd.DataFrame:
+    """Read a Parquet file with Arrow-backed strings.
+
+    The file is memory-mapped and the Arrow table releases its buffers as pandas takes
+    them over, so the read does not hold two full copies of the data.
+    """
+    table = pq.read_table(path, columns=columns, memory_map=True)
+    df = table.to_pandas(types_mapper=_arrow_string_dtype, self_destruct=True)
+    del table
+    return df
+
+
+def _write_s3_snapshot(source: "DataSource", last_modified: str, df: pd.DataFrame) -> None:
+    """Write processed S3 data as Parquet keyed by its S3 modification time.
+
+    The file is written atomically and older snapshots of the same source are removed.
+    """
+    snapshot_path = _s3_snapshot_path(source, last_modified)
+    if df.empty or snapshot_path is None:
+        return
+    tmp_path = snapshot_path.with_name(snapshot_path.name + ".tmp")
+    try:
+        snapshot_path.parent.mkdir(parents=True, exist_ok=True)
+        df.to_parquet(tmp_path, engine="pyarrow", compression="zstd", index=False)
+        os.replace(tmp_path, snapshot_path)
+    except Exception as e:
+        logger.warning(f"Could not write processed snapshot {snapshot_path}: {e}")
+        return
+
+    for old_path in _PROCESSED_DIR.glob(_s3_snapshot_glob(source)):
+        if old_path != snapshot_path:
+            try:
+                old_path.unlink()
+            except OSError:
+                pass
+
+
+def _latest_s3_snapshot(source: "DataSource") -> Optional[Path]:
+    """Newest processed S3 snapshot for a source, by the timestamp in its filename.
+
+    The directory scan is reused until the directory itself changes: adding, replacing,
+    or removing a snapshot updates its mtime, so one stat replaces the listing.
+    """
+    try:
+        dir_stat = _PROCESSED_DIR.stat()
+    except OSError:
+        return None
+    dir_key = (dir_stat.st_dev, dir_stat.st_ino, dir_stat.st_mtime_ns)
+    cached = _snapshot_scans.get(source.value)
+    if cached is not None and cached[0] == dir_key:
+        return cached[1]
+    snapshots = sorted(_PROCESSED_DIR.glob(_s3_snapshot_glob(source)))
+    latest = snapshots[-1] if snapshots else None
+    _snapshot_scans[source.value] = (dir_key, latest)
+    return latest
+
+
+def _count_duplicates(values: pd.Series) -> int:
+    """Count repeated values, hashing integer codes when the column is already categorical.
+
+    Other dtypes are counted from one hash-set build with nunique, which skips the
+    boolean mask duplicated() materializes; casting to category would itself hash every
+    value, and text loaded from Parquet is already Arrow-backed rather than Python objects.
+    """
+    if isinstance(values.dtype, pd.CategoricalDtype):
+        # Missing values have code -1; shift so they get their own bin
+        codes = values.cat.codes.to_numpy().astype(np.intp) + 1
+        return int(codes.size - np.count_nonzero(np.bincount(codes)))
+    # Missing values count as one distinct value, as duplicated() treats them
+    return len(values) - int(values.nunique(dropna=False))
+
+
+def _rename_to_schema(df: pd.DataFrame, column_map: Dict[str, str]) -> pd.DataFrame:
+    """Rename raw export columns onto the standardized schema in a single pass.
+
+    A standardized column that already exists is replaced by the renamed raw column,
+    matching the earlier behaviour of copying raw columns over it.
+    """
+    renames = {old: new for old, new in column_map.items() if old in df.columns}
+    replaced = [new for new in renames.values() if new in df.columns]
+    return df.drop(columns=replaced).rename(columns=renames)
+
 
 class DataSource(Enum):
     """Enumeration of available data sources with clear purpose definitions."""
@@ -59,6 +236,125 @@ class DataFormat(Enum):
     PARQUET = ".parquet"  # Internal cache format only (not used for S3 ingestion)
 
 
+# Daily cache refreshes happen once per process per day, at the first check after this hour
+_DAILY_REFRESH_HOUR = 4
+_last_daily_refresh_period: Optional[date] = None
+_daily_refresh_lock = threading.Lock()
+
+# Set once the critical sources are preloaded; refresh_data_cache clears it so the next
+# preload warms the emptied caches. The lock makes concurrent preloads wait for the first.
+_preload_lock = threading.Lock()
+_preload_done = threading.Event()
+
+# Columns validate_data_integrity requires per source
+_DEFAULT_REQUIRED_COLUMNS = ("Full Name", "Project ID")
+_REQUIRED_COLUMNS = {DataSource.PROVIDER_DATA: ("Full Name", "Referral Count")}
+
+# Inclusive value bounds validate_data_integrity checks for any source that has the column;
+# a row with any value outside its bounds counts once as an invalid coordinate
+_VALUE_BOUNDS = {"Latitude": (-90.0, 90.0), "Longitude": (-180.0, 180.0)}
+
+# In-process LRU of processed frames keyed by (source, last_modified, filename). Hits skip
+# Streamlit's argument hashing and the unpickling copy st.cache_data makes on every lookup.
+_PROCESSED_MEMO_SIZE = 32
+_processed_memo: "OrderedDict[Tuple[str, str, str], pd.DataFrame]" = OrderedDict()
+_processed_memo_lock = threading.Lock()
+
+
+def _memo_get(key: Tuple[str, str, str]) -> Optional[pd.DataFrame]:
+    """Return a memoized processed frame, marking it most recently used."""
+    with _processed_memo_lock:
+        df = _processed_memo.get(key)
+        if df is not None:
+            _processed_memo.move_to_end(key)
+        return df
+
+
+def _memo_put(key: Tuple[str, str, str], df: pd.DataFrame) -> None:
+    """Memoize a processed frame, evicting the least recently used beyond the size limit."""
+    with _processed_memo_lock:
+        _processed_memo[key] = df
+        _processed_memo.move_to_end(key)
+        while len(_processed_memo) > _PROCESSED_MEMO_SIZE:
+            _processed_memo.popitem(last=False)
+
+
+# Latest referral file split into (inbound, outbound, combined), keyed by filename and
+# content digest. The referral sources all come from one S3 file, so a cold load of all of
+# them (e.g. validate_all_data_sources) parses it once; the lock makes concurrent loads
+# wait for that parse instead of repeating it.
+_referral_split: Optional[Tuple[Tuple[str, str], Tuple[pd.DataFrame, pd.DataFrame, pd.DataFrame]]] = None
+_referral_split_lock = threading.Lock()
+
+
+# Per-source load counters reported by get_ingestion_stats: hits answered by the in-process
+# memo, misses that went further (Streamlit cache, snapshot, download, or local parquet),
+# and the wall time of the most recent load
+_ingestion_stats: Dict[str, Dict[str, Union[int, float]]] = {}
+_ingestion_stats_lock = threading.Lock()
+
+
+def _record_load(source: "DataSource", hit: bool, started: float) -> None:
+    """Count a load of a source as a memo hit or miss and keep its duration."""
+    elapsed_ms = round((time.perf_counter() - started) * 1000, 1)
+    with _ingestion_stats_lock:
+        stats = _ingestion_stats.setdefault(source.value, {"hits": 0, "misses": 0, "last_load_ms": 0.0})
+        stats["hits" if hit else "misses"] += 1
+        stats["last_load_ms"] = elapsed_ms
+
+
+def _clear_processed_memo() -> None:
+    """Drop every memoized processed frame."""
+    global _referral_split
+    with _processed_memo_lock:
+        _processed_memo.clear()
+    with _referral_split_lock:
+        _referral_split = None
+
+
+# Column map per referral direction; iteration order (outbound first) is the row order
+# used when one raw row yields both directions
+_REFERRAL_COLUMN_MAPS = {
+    DataSource.OUTBOUND_REFERRALS: _OUTBOUND_COLUMN_MAP,
+    DataSource.INBOUND_REFERRALS: _INBOUND_COLUMN_MAP,
+}
+
+# Prepared parquet file per source in data/processed, used when S3 is unavailable
+_LOCAL_PARQUET_FILES = {
+    DataSource.INBOUND_REFERRALS: "cleaned_inbound_referrals.parquet",
+    DataSource.OUTBOUND_REFERRALS: "cleaned_outbound_referrals.parquet",
+    DataSource.ALL_REFERRALS: "cleaned_all_referrals.parquet",
+    DataSource.PREFERRED_PROVIDERS: "cleaned_preferred_providers.parquet",
+    DataSource.PROVIDER_DATA: "cleaned_outbound_referrals.parquet",  # Will be processed
+}
+
+
+def _local_parquet_path(source: DataSource) -> Path:
+    """Local parquet file to load for a source: the S3 snapshot or the cleaned file, whichever is newer.
+
+    Snapshots from an earlier S3 run must not hide cleaned files written later (e.g. by the
+    Update Data page), so the two are compared by modification time.
+    """
+    cleaned_path = _PROCESSED_DIR / _LOCAL_PARQUET_FILES[source]
+    snapshot_path = _latest_s3_snapshot(source)
+    if snapshot_path is None:
+        return cleaned_path
+    try:
+        cleaned_mtime = cleaned_path.stat().st_mtime_ns
+    except OSError:
+        return snapshot_path
+    try:
+        snapshot_mtime = snapshot_path.stat().st_mtime_ns
+    except OSError:
+        return cleaned_path
+    return snapshot_path if snapshot_mtime >= cleaned_mtime else cleaned_path
+
+
+def _s3_folder_type(source: DataSource) -> str:
+    """S3 folder holding the file a source is processed from."""
+    return "preferred_providers" if source == DataSource.PREFERRED_PROVIDERS else "referrals"
+
+
 class DataIngestionManager:
     """
     Centralized data ingestion manager with optimized loading strategies.
@@ -88,15 +384,20 @@ class DataIngestionManager:
         Initialize the data ingestion manager.
         """
         self.cache_ttl = 3600  # 1 hour cache for optimal performance
-        self._s3_client = S3DataClient()
+        # Share the process-wide cached client so boto3 sessions are not rebuilt per manager
+        self._s3_client = get_optimized_s3_client()
 
     def _get_s3_data(self, folder_type: str) -> Tuple[Optional[bytes], Optional[str], Optional[str]]:
         """
-        Download the latest data from S3 for the given folder type.
+        Get the latest data from S3 for the given folder type.
 
         Supports both CSV and Excel formats. The S3 client automatically lists
         files with extensions: .csv, .xlsx, .xls
 
+        Only the requested folder's latest file is downloaded, and the bytes are not
+        cached: loads are reused through the version-keyed _load_and_process_data_cached
+        and its Parquet snapshots, which call this only on a miss.
+
         Args:
             folder_type: Type of data to download ('referrals' or 'preferred_providers')
 
@@ -104,52 +405,103 @@ class DataIngestionManager:
             Tuple of (data_bytes, filename, last_modified_iso) or (None, None, None) if download fails
             The filename extension determines the parsing method (CSV preferred, Excel fallback)
         """
-        try:
-            files = self._s3_client.list_files_batch([folder_type]).get(folder_type, [])
-            if not files:
-                logger.warning(f"No files found in S3 folder '{folder_type}'")
-                return None, None, None
-
-            latest_filename, last_modified = files[0]
-            logger.info(f"Found latest file '{latest_filename}' from S3 (modified: {last_modified})")
-
-            file_bytes = self._s3_client.download_file(folder_type, latest_filename)
-            if file_bytes:
-                # Return ISO format string for cache key
-                last_modified_iso = last_modified.isoformat() if last_modified else None
-                return file_bytes, latest_filename, last_modified_iso
+        filename, last_modified_iso = self._list_latest_s3_files().get(folder_type, (None, None))
+        if not filename:
             return None, None, None
+        try:
+            file_bytes = self._s3_client.download_file(folder_type, filename)
         except Exception as e:
             logger.error(f"Failed to download {folder_type} from S3: {str(e)}")
             return None, None, None
+        if not file_bytes:
+            return None, None, None
+        return file_bytes, filename, last_modified_iso
 
-    @st.cache_data(ttl=3600, show_spinner=False)
+    @st.cache_data(ttl=60, show_spinner=False)
+    def _list_latest_s3_files(_self) -> Dict[str, Tuple[str, Optional[str]]]:
+        """
+        Find the latest file of every S3 folder with one batched listing.
+
+        The listing is cached briefly and shared by downloads, processed-data cache
+        lookups and get_data_status, so a rerun issues at most one LIST round.
+
+        Returns:
+            Dictionary mapping folder type to (filename, last_modified_iso) for folders
+            that contain files
+        """
+        try:
+            listings = _self._s3_client.list_files_batch(list(_S3_FOLDER_TYPES))
+        except Exception as e:
+            logger.error(f"Failed to list S3 folders: {str(e)}")
+            return {}
+
+        latest = {}
+        for folder_type in _S3_FOLDER_TYPES:
+            files = listings.get(folder_type, [])
+            if not files:
+                logger.warning(f"No files found in S3 folder '{folder_type}'")
+                continue
+            filename, last_modified = files[0]
+            logger.info(f"Found latest file '{filename}' from S3 (modified: {last_modified})")
+            # ISO format string for cache keys
+            latest[folder_type] = (filename, last_modified.isoformat() if last_modified else None)
+        return latest
+
+    @st.cache_data(ttl=3600, show_spinner=False, max_entries=16)
     def _load_and_process_data_cached(
-        _self, source: DataSource, last_modified: str, data_bytes: bytes, filename: str
+        _self, source: DataSource, last_modified: str, filename: str, _fetch_bytes: Callable[[], Optional[bytes]]
     ) -> pd.DataFrame:
         """
         Process downloaded data into a clean DataFrame with Streamlit caching.
 
-        This method is cached based on source, last_modified timestamp, and data content.
-        The cache automatically invalidates when:
+        This method is cached in memory based on source, last_modified timestamp, and
+        filename. The cache automatically invalidates when:
         - The S3 file is updated (detected via last_modified timestamp)
-        - The TTL expires (1 hour)
         - Manual cache refresh is triggered
 
+        The only persistent layer is the zstd Parquet snapshot each freshly processed
+        result is written to in data/processed, keyed by last_modified. A cache miss for
+        the same version, including the first load of a new app process or after a cache
+        refresh, reads that snapshot instead of downloading and parsing the file again,
+        and _load_from_local_parquet serves it when S3 is unavailable.
+
+        The file is fetched through _fetch_bytes only on a cache miss, and the fetcher is
+        excluded from Streamlit's argument hashing (leading underscore): last_modified
+        already identifies the S3 object version, so a cold start with a current snapshot
+        needs only the S3 listing, not a download.
+
         File Format Handling:
-        - CSV files: Parsed using pd.read_csv() for optimal performance
+        - CSV files: Parsed with pyarrow's multithreaded reader (io_utils.read_csv)
         - Excel files: Parsed using pd.read_excel() with automatic fallback
         - Format detection: Based on filename extension from S3
 
         Args:
             source: Data source to process
-            last_modified: Last modified timestamp for cache invalidation
-            data_bytes: Raw data bytes from S3 (CSV or Excel format)
+            last_modified: Last modified timestamp (or content digest) for cache invalidation
             filename: Filename for logging and format detection
+            _fetch_bytes: Returns the raw S3 file bytes (CSV or Excel format), or None
 
         Returns:
             Processed DataFrame cached in Streamlit's st.cache_data
+
+        Raises:
+            RuntimeError: If the file could not be downloaded; nothing is cached then
         """
+        # A snapshot of this exact version (e.g. after a cache refresh) is reused without
+        # downloading or re-parsing the CSV/Excel file.
+        snapshot_path = _s3_snapshot_path(source, last_modified)
+        if snapshot_path is not None and snapshot_path.exists():
+            try:
+                df = _read_parquet(snapshot_path)
+                logger.info(f"Loaded {len(df)} records for {source.value} from snapshot {snapshot_path}")
+                return df
+            except Exception as e:
+                logger.warning(f"Could not read processed snapshot {snapshot_path}: {e}")
+
+        data_bytes = _fetch_bytes()
+        if not data_bytes:
+            raise RuntimeError(f"S3 download failed for {source.value}")
+
         try:
             # Process the data based on source type
             if source == DataSource.PREFERRED_PROVIDERS:
@@ -160,6 +512,7 @@ class DataIngestionManager:
                 df = _self._process_referral_data(source, data_bytes, filename)
 
             logger.info(f"Processed {len(df)} records for {source.value}")
+            _write_s3_snapshot(source, last_modified, df)
             return df
 
         except Exception as e:
@@ -173,7 +526,8 @@ class DataIngestionManager:
         If S3 is not configured or fails, falls back to local parquet files as cache.
 
         This method handles the complete pipeline from S3 download to processed DataFrame,
-        cached in Streamlit's cache system.
+        cached in Streamlit's cache system. Repeat loads of the same S3 object version are
+        answered from an in-process LRU before reaching st.cache_data.
 
         Args:
             source: Data source to load and process
@@ -183,22 +537,40 @@ class DataIngestionManager:
         """
         try:
             # Determine which S3 folder to use
-            if source == DataSource.PREFERRED_PROVIDERS:
-                folder_type = "preferred_providers"
-            else:
-                folder_type = "referrals"
+            folder_type = _s3_folder_type(source)
 
-            # Download data from S3
-            data_bytes, filename, last_modified = self._get_s3_data(folder_type)
-            if not data_bytes:
+            # Identify the latest S3 object from the shared listing; it is downloaded
+            # only if its processed form is not already cached
+            filename, last_modified = self._list_latest_s3_files().get(folder_type, (None, None))
+            if not filename:
                 logger.warning(f"No S3 data available for {source.value}, attempting local fallback")
                 # Try to load from local parquet files as fallback
                 return self._load_from_local_parquet(source)
 
-            # Use the cached processing method with last_modified as cache key
-            return self._load_and_process_data_cached(
-                source, last_modified or "unknown", data_bytes, filename or "unknown"
-            )
+            # Use the cached processing method with last_modified as cache key; the content
+            # is downloaded and hashed up front only when S3 did not report a modification time
+            data_bytes = None
+            if not last_modified:
+                data_bytes = self._get_s3_data(folder_type)[0]
+                if not data_bytes:
+                    logger.warning(f"No S3 data available for {source.value}, attempting local fallback")
+                    return self._load_from_local_parquet(source)
+                last_modified = "blake2b:" + hashlib.blake2b(data_bytes, digest_size=16).hexdigest()
+
+            def fetch_bytes() -> Optional[bytes]:
+                return data_bytes if data_bytes is not None else self._get_s3_data(folder_type)[0]
+
+            started = time.perf_counter()
+            memo_key = (source.value, last_modified, filename)
+            df = _memo_get(memo_key)
+            hit = df is not None
+            if not hit:
+                df = self._load_and_process_data_cached(source, last_modified, filename, fetch_bytes)
+                if not df.empty:
+                    _memo_put(memo_key, df)
+            _record_load(source, hit, started)
+            # Shallow copy: callers get their own frame while column data stays shared (copy-on-write)
+            return df.copy(deep=False)
 
         except Exception as e:
             logger.error(f"Failed to load and process {source.value}: {str(e)}")
@@ -211,6 +583,7 @@ class DataIngestionManager:
         Load data from local parquet cache files when S3 is unavailable.
 
         This serves as a fallback mechanism for development and testing when S3 is not configured.
+        A snapshot of previously processed S3 data is used when it is newer than the cleaned file.
 
         Args:
             source: Data source to load
@@ -218,34 +591,31 @@ class DataIngestionManager:
         Returns:
             DataFrame from local parquet file, or empty DataFrame if not found
         """
-        # Map data sources to parquet filenames
-        parquet_map = {
-            DataSource.INBOUND_REFERRALS: "cleaned_inbound_referrals.parquet",
-            DataSource.OUTBOUND_REFERRALS: "cleaned_outbound_referrals.parquet",
-            DataSource.ALL_REFERRALS: "cleaned_all_referrals.parquet",
-            DataSource.PREFERRED_PROVIDERS: "cleaned_preferred_providers.parquet",
-            DataSource.PROVIDER_DATA: "cleaned_outbound_referrals.parquet",  # Will be processed
-        }
-
-        parquet_filename = parquet_map.get(source)
+        parquet_filename = _LOCAL_PARQUET_FILES.get(source)
         if not parquet_filename:
             logger.error(f"No parquet mapping for source: {source.value}")
             return pd.DataFrame()
 
-        parquet_path = Path("data/processed") / parquet_filename
+        parquet_path = _local_parquet_path(source)
 
         if not parquet_path.exists():
             logger.warning(f"Local parquet file not found: {parquet_path}")
             return pd.DataFrame()
 
         try:
-            df = pd.read_parquet(parquet_path)
+            started = time.perf_counter()
+            columns = None
+            if source == DataSource.PROVIDER_DATA:
+                schema_names = pq.read_schema(parquet_path).names
+                columns = [col for col in _PROVIDER_SOURCE_COLUMNS if col in schema_names]
+            df = _read_parquet(parquet_path, columns=columns)
             logger.info(f"Loaded {len(df)} rows from local parquet: {parquet_path}")
 
             # For provider data, apply aggregation processing
             if source == DataSource.PROVIDER_DATA:
                 df = self._process_provider_data(df)
 
+            _record_load(source, False, started)
             return df
         except Exception as e:
             logger.error(f"Failed to read local parquet {parquet_path}: {e}")
@@ -256,7 +626,8 @@ class DataIngestionManager:
         Process referral data from S3 bytes (CSV or Excel format).
 
         The preparation module automatically detects file format based on filename
-        and applies appropriate parsing (pd.read_csv or pd.read_excel).
+        and applies appropriate parsing (io_utils.read_csv or pd.read_excel). The split
+        of the latest file is kept, so the other referral sources reuse it.
 
         Args:
             source: The specific referral data source
@@ -266,9 +637,18 @@ class DataIngestionManager:
         Returns:
             Processed DataFrame with standardized schema
         """
-        # Use the preparation function to process the data
-        # It handles both CSV and Excel formats automatically
-        inbound_df, outbound_df, combined_df, _ = process_referral_data(data_bytes, filename=filename)
+        global _referral_split
+        key = (filename, hashlib.blake2b(data_bytes, digest_size=16).hexdigest())
+        with _referral_split_lock:
+            if _referral_split is not None and _referral_split[0] == key:
+                inbound_df, outbound_df, combined_df = _referral_split[1]
+            else:
+                # Use the preparation function to process the data
+                # It handles both CSV and Excel formats automatically, parsing only the consumed columns
+                inbound_df, outbound_df, combined_df, _ = process_referral_data(
+                    data_bytes, filename=filename, project_columns=True
+                )
+                _referral_split = (key, (inbound_df, outbound_df, combined_df))
 
         # Return the appropriate DataFrame based on source
         if source == DataSource.INBOUND_REFERRALS:
@@ -312,45 +692,32 @@ class DataIngestionManager:
             logger.info("Deduplicated preferred providers (no Person ID column): %d unique providers", len(df))
 
         # Clean geo data
-        lat_col = "Contact's Details: Latitude"
-        lon_col = "Contact's Details: Longitude"
-
-        if {lat_col, lon_col}.issubset(df.columns):
-            df = df.dropna(subset=[lat_col, lon_col])
+        if set(_PREFERRED_GEO_COLUMNS).issubset(df.columns):
+            df = df.dropna(subset=list(_PREFERRED_GEO_COLUMNS))
 
         # Rename columns to match expected schema
-        column_mapping = {
-            "Contact Full Name": "Full Name",
-            "Contact's Work Phone": "Work Phone",
-            "Contact's Work Address": "Work Address",
-            lat_col: "Latitude",
-            lon_col: "Longitude",
-            "Contact's Details: Specialty": "Specialty",
-            "Contact's Details: Last Verified Date": "Last Verified Date",
-            "Contact's Details: Person ID": "Person ID",
-        }
-
-        for old_col, new_col in column_mapping.items():
-            if old_col in df.columns:
-                df[new_col] = df[old_col]
+        df = _rename_to_schema(df, _PREFERRED_COLUMN_MAP)
 
         # Standardize dates for preferred providers
         df = self._standardize_dates(df)
 
-        # Log information about the preferred providers data loaded
+        # Log information about the preferred providers data loaded. nunique() is a full hash
+        # pass, and len(df) bounds it, so it is only computed when logging or the check needs it.
         if not df.empty and "Full Name" in df.columns:
-            unique_providers = df["Full Name"].nunique()
-            logger.info(
-                f"Loaded preferred providers file '{filename}': " f"{len(df)} rows, {unique_providers} unique providers"
-            )
-
-            # Validation: Check if this looks like it might be the wrong file
-            # Preferred providers lists are typically smaller than the full provider database
-            # If we see more than 100 unique providers, log a warning
-            if unique_providers > 100:
-                global _preferred_providers_warning_logged
+            global _preferred_providers_warning_logged
+
+            check_size = len(df) > 100 and not _preferred_providers_warning_logged
+            if check_size or logger.isEnabledFor(logging.INFO):
+                unique_providers = df["Full Name"].nunique()
+                logger.info(
+                    f"Loaded preferred providers file '{filename}': "
+                    f"{len(df)} rows, {unique_providers} unique providers"
+                )
 
-                if not _preferred_providers_warning_logged:
+                # Validation: Check if this looks like it might be the wrong file
+                # Preferred providers lists are typically smaller than the full provider database
+                # If we see more than 100 unique providers, log a warning
+                if check_size and unique_providers > 100:
                     logger.warning(
                         f"WARNING: Preferred providers file contains {unique_providers} unique providers. "
                         "This is unusually high. Please verify that the correct file was uploaded to the "
@@ -390,13 +757,10 @@ class DataIngestionManager:
         if file_type == "cleaned" or self._is_cleaned_data(df):
             return df
 
-        df = df.copy()
-
-        # Apply source-specific transformations for raw data
-        if source == DataSource.OUTBOUND_REFERRALS:
-            df = self._process_outbound_referrals(df)
-        elif source == DataSource.INBOUND_REFERRALS:
-            df = self._process_inbound_referrals(df)
+        # Apply source-specific transformations for raw data. No defensive copy is needed:
+        # each processor builds a new frame (rename/assign/concat) and leaves df untouched.
+        if source in _REFERRAL_COLUMN_MAPS:
+            df = self._process_referrals(df, source)
         elif source == DataSource.ALL_REFERRALS:
             df = self._process_all_referrals(df)
 
@@ -411,61 +775,30 @@ class DataIngestionManager:
         - Contains referral_type column for type identification
         - Has proper data types and formatting
         """
-        # Key indicators of cleaned data
-        cleaned_indicators = {"Full Name", "Work Address", "Work Phone", "Latitude", "Longitude", "referral_type"}
-        return len(cleaned_indicators.intersection(set(df.columns))) >= 4
-
-    def _process_outbound_referrals(self, df: pd.DataFrame) -> pd.DataFrame:
-        """
-        Process raw outbound referrals data from Excel source.
-
-        Maps raw Excel columns to standardized schema and handles data cleaning.
-        """
-        # Standard column mapping for raw Excel data
-        if "Referred To Full Name" in df.columns:
-            column_mapping = {
-                "Referred To Full Name": "Full Name",
-                "Referred To's Work Phone": "Work Phone",
-                "Referred To's Work Address": "Work Address",
-                "Referred To's Details: Latitude": "Latitude",
-                "Referred To's Details: Longitude": "Longitude",
-                "Referred To's Details: Last Verified Date": "Last Verified Date",
-            }
-
-            for old_col, new_col in column_mapping.items():
-                if old_col in df.columns:
-                    df[new_col] = df[old_col]
-
-        # Add referral type identifier
-        df["referral_type"] = "outbound"
-
-        # Standardize dates
-        df = self._standardize_dates(df)
-        return df
-
-    def _process_inbound_referrals(self, df: pd.DataFrame) -> pd.DataFrame:
+        # Probe the six indicators against the column index's hash lookup rather than
+        # walking every column, so wide raw exports cost the same as narrow frames
+        columns = df.columns
+        matches = 0
+        for col in _CLEANED_INDICATORS:
+            if col in columns:
+                matches += 1
+                if matches >= 4:
+                    return True
+        return False
+
+    def _process_referrals(self, df: pd.DataFrame, source: DataSource) -> pd.DataFrame:
         """
-        Process raw inbound referrals data from Excel source.
+        Process raw inbound or outbound referrals data from Excel source.
 
-        Maps referral source information to provider format.
+        Maps the direction's raw contact columns to the standardized schema, tags
+        rows with referral_type and standardizes dates.
         """
-        # Map referral source columns for inbound data
-        if "Referred From Full Name" in df.columns:
-            column_mapping = {
-                "Referred From Full Name": "Full Name",
-                "Referred From's Work Phone": "Work Phone",
-                "Referred From's Work Address": "Work Address",
-                "Referred From's Details: Latitude": "Latitude",
-                "Referred From's Details: Longitude": "Longitude",
-                "Referred From's Details: Last Verified Date": "Last Verified Date",
-            }
-
-            for old_col, new_col in column_mapping.items():
-                if old_col in df.columns:
-                    df[new_col] = df[old_col]
+        column_map = _REFERRAL_COLUMN_MAPS[source]
+        if next(iter(column_map)) in df.columns:
+            df = _rename_to_schema(df, column_map)
 
-        # Add referral type identifier
-        df["referral_type"] = "inbound"
+        # Add referral type identifier ("outbound" or "inbound")
+        df = df.assign(referral_type=source.value)
 
         # Standardize dates
         df = self._standardize_dates(df)
@@ -477,36 +810,28 @@ class DataIngestionManager:
 
         This processes the full dataset and separates inbound/outbound referrals.
         """
-        # For all referrals, we need to process both inbound and outbound in one pass
-        processed_rows = []
-
-        for _, row in df.iterrows():
-            # Process outbound referral if present
-            if pd.notna(row.get("Referred To Full Name")):
-                outbound_row = row.copy()
-                outbound_row["Full Name"] = row.get("Referred To Full Name")
-                outbound_row["Work Phone"] = row.get("Referred To's Work Phone")
-                outbound_row["Work Address"] = row.get("Referred To's Work Address")
-                outbound_row["Latitude"] = row.get("Referred To's Details: Latitude")
-                outbound_row["Longitude"] = row.get("Referred To's Details: Longitude")
-                outbound_row["Last Verified Date"] = row.get("Referred To's Details: Last Verified Date")
-                outbound_row["referral_type"] = "outbound"
-                processed_rows.append(outbound_row)
-
-            # Process inbound referral if present
-            if pd.notna(row.get("Referred From Full Name")):
-                inbound_row = row.copy()
-                inbound_row["Full Name"] = row.get("Referred From Full Name")
-                inbound_row["Work Phone"] = row.get("Referred From's Work Phone")
-                inbound_row["Work Address"] = row.get("Referred From's Work Address")
-                inbound_row["Latitude"] = row.get("Referred From's Details: Latitude")
-                inbound_row["Longitude"] = row.get("Referred From's Details: Longitude")
-                inbound_row["Last Verified Date"] = row.get("Referred From's Details: Last Verified Date")
-                inbound_row["referral_type"] = "inbound"
-                processed_rows.append(inbound_row)
-
-        if processed_rows:
-            df = pd.DataFrame(processed_rows)
+        # Each raw row yields an outbound row and/or an inbound row, depending on which
+        # contact is present; both directions are built as whole-frame slices.
+        parts = []
+        positions = []
+        for source, column_map in _REFERRAL_COLUMN_MAPS.items():
+            name_col = next(iter(column_map))
+            if name_col not in df.columns:
+                continue
+            mask = df[name_col].notna().to_numpy()
+            if not mask.any():
+                continue
+            # Rename the direction's raw columns in place of copying them; mapped fields the
+            # export lacks are added as missing in the same assign as referral_type
+            part = _rename_to_schema(df.loc[mask], column_map)
+            absent = {new_col: np.nan for new_col in column_map.values() if new_col not in part.columns}
+            parts.append(part.assign(**absent, referral_type=source.value))
+            positions.append(np.flatnonzero(mask))
+
+        if parts:
+            # Restore source row order, outbound before inbound for the same row
+            order = np.argsort(np.concatenate(positions), kind="stable")
+            df = pd.concat(parts).iloc[order]
             df = self._standardize_dates(df)
 
         return df
@@ -519,7 +844,7 @@ class DataIngestionManager:
         This always aggregates data to create the provider view, even from cleaned data.
         """
         # If this already has aggregated referral counts, return as-is
-        if "Referral Count" in df.columns and len(df["Full Name"].unique()) == len(df):
+        if "Referral Count" in df.columns and df["Full Name"].is_unique:
             return df
 
         # Make sure we have the required columns for aggregation
@@ -541,7 +866,13 @@ class DataIngestionManager:
             agg_dict["Last Verified Date"] = "max"  # Most recent verification date
 
         try:
-            provider_df = df.groupby("Full Name", as_index=False).agg(agg_dict)
+            # Group on categorical codes rather than hashing every name string; observed/sort=False
+            # skip empty categories and the key sort, since ranking re-sorts results anyway
+            name_dtype = df["Full Name"].dtype
+            grouped = df.assign(**{"Full Name": df["Full Name"].astype("category")})
+            provider_df = grouped.groupby("Full Name", observed=True, sort=False, as_index=False).agg(agg_dict)
+            # Restore the original key dtype so merges with referral tables still line up
+            provider_df["Full Name"] = provider_df["Full Name"].astype(name_dtype)
 
             # Rename count column to Referral Count
             if "Project ID" in provider_df.columns:
@@ -549,17 +880,20 @@ class DataIngestionManager:
             else:
                 provider_df["Referral Count"] = 1
 
-            # Clean up missing values in text columns
-            text_cols = ["Work Address", "Work Phone", "Referral Source"]
-            for col in text_cols:
-                if col in provider_df.columns:
-                    provider_df[col] = provider_df[col].astype(str).replace(["nan", "None", "NaN", ""], "").fillna("")
+            # Blank out missing values in text columns; preparation keeps them as real NA
+            text_cols = [col for col in ["Work Address", "Work Phone", "Referral Source"] if col in provider_df.columns]
+            if text_cols:
+                provider_df[text_cols] = provider_df[text_cols].fillna("").astype(pd.StringDtype("pyarrow"))
 
-            # Ensure numeric columns are properly typed
-            numeric_cols = ["Latitude", "Longitude", "Referral Count"]
+            # Ensure numeric columns are properly typed. Coordinates stay float64: they are
+            # the source for display, bounds checks, and the haversine fallback, and the
+            # float32 copies the distance kernel needs are cached by add_coordinate_trig_columns.
+            numeric_cols = ["Latitude", "Longitude"]
             for col in numeric_cols:
                 if col in provider_df.columns:
                     provider_df[col] = pd.to_numeric(provider_df[col], errors="coerce")
+            # Group counts are never missing; int32 halves the bytes every later scan touches
+            provider_df["Referral Count"] = provider_df["Referral Count"].astype(np.int32)
 
             return provider_df
 
@@ -574,27 +908,26 @@ class DataIngestionManager:
         Handles multiple date column names and creates a unified 'Referral Date' column.
         Validates dates to ensure they fall within reasonable ranges.
         """
-        date_columns = ["Create Date", "Date of Intake", "Sign Up Date"]
-
-        for col in date_columns:
-            if col in df.columns:
-                df[col] = pd.to_datetime(df[col], errors="coerce")
-                # Filter out unrealistic dates (before 1990)
-                df.loc[df[col] < pd.Timestamp("1990-01-01"), col] = pd.NaT
-
-        # Standardize Last Verified Date
-        if "Last Verified Date" in df.columns:
-            df["Last Verified Date"] = pd.to_datetime(df["Last Verified Date"], errors="coerce")
-            # Filter out unrealistic dates (before 1990)
-            df.loc[df["Last Verified Date"] < pd.Timestamp("1990-01-01"), "Last Verified Date"] = pd.NaT
-
-        # Create unified Referral Date column
-        if "Referral Date" not in df.columns:
-            # Use first available date column as Referral Date
-            for col in date_columns:
-                if col in df.columns:
-                    df["Referral Date"] = df[col]
-                    break
+        date_columns = [col for col in _REFERRAL_DATE_COLUMNS if col in df.columns]
+
+        validated_columns = date_columns + (["Last Verified Date"] if "Last Verified Date" in df.columns else [])
+
+        # Filter out unrealistic dates (before 1990 or after 2100) with one range mask per column
+        for col in validated_columns:
+            dates = df[col]
+            # Parquet, Excel, and pyarrow's CSV reader usually hand over typed timestamps already;
+            # text is parsed with the format pandas infers from its first value, not per element
+            if not pd.api.types.is_datetime64_any_dtype(dates):
+                dates = pd.to_datetime(dates, errors="coerce")
+            df[col] = dates.where(dates.between(_MIN_VALID_DATE, _MAX_VALID_DATE))
+
+        # Create unified Referral Date column from the first non-null date in each row; chained
+        # column fills avoid bfill(axis=1), which builds a row-wise copy of every date column
+        if "Referral Date" not in df.columns and date_columns:
+            referral_dates = df[date_columns[0]]
+            for col in date_columns[1:]:
+                referral_dates = referral_dates.fillna(df[col])
+            df["Referral Date"] = referral_dates
 
         return df
 
@@ -605,27 +938,53 @@ class DataIngestionManager:
         Returns information about S3 availability and data processing status
         for all configured data sources.
 
+        Availability and modification times are taken from one batched listing of
+        the S3 folders; file contents are not downloaded. Results are cached for 60 seconds so Streamlit
+        reruns do not re-list the bucket.
+
         Returns:
             Dictionary mapping source names to their status information
         """
-        status = {}
+        return self._get_data_status_cached()
 
+    @st.cache_data(ttl=60, show_spinner=False)
+    def _get_data_status_cached(_self) -> Dict[str, Dict[str, Union[bool, str]]]:
+        """Build the get_data_status result from a single S3 listing of both folders."""
+        latest = _self._list_latest_s3_files()
+
+        status = {}
         for source in DataSource:
-            # Check if S3 data is available
-            folder_type = "preferred_providers" if source == DataSource.PREFERRED_PROVIDERS else "referrals"
-            data_bytes, filename, last_modified = self._get_s3_data(folder_type)
-            available = data_bytes is not None
+            filename, last_modified = latest.get(_s3_folder_type(source), (None, None))
+            available = filename is not None
 
             status[source.value] = {
                 "available": available,
                 "file_type": "s3" if available else "none",
-                "filename": filename if available else None,
+                "filename": filename,
+                "last_modified": last_modified,
                 "optimized": True,  # Always processed fresh from S3
                 "performance_tier": "fast",  # Direct processing from S3
             }
 
         return status
 
+    def _source_version(self, source: DataSource) -> Tuple[str, str, str]:
+        """
+        Identify the data version load_data would return for a source, without loading it.
+
+        With S3 enabled this is the latest file and modification time from the shared
+        listing; otherwise it is the local parquet file load_data falls back to and its mtime.
+        """
+        if config.is_api_enabled("s3"):
+            filename, last_modified = self._list_latest_s3_files().get(_s3_folder_type(source), (None, None))
+            return ("s3", filename or "", last_modified or "")
+        path = _local_parquet_path(source)
+        try:
+            mtime = str(path.stat().st_mtime_ns)
+        except OSError:
+            mtime = ""
+        return ("local", str(path), mtime)
+
     def load_data(self, source: DataSource, show_status: bool = True) -> pd.DataFrame:
         """
         Public method to load data for a given DataSource.
@@ -635,13 +994,14 @@ class DataIngestionManager:
 
         File Format Support:
         - Automatically detects CSV (.csv) or Excel (.xlsx, .xls) format
-        - CSV files are parsed with pd.read_csv() for optimal performance
+        - CSV files are parsed with pyarrow's multithreaded reader (io_utils.read_csv)
         - Excel files are parsed with pd.read_excel() with CSV fallback
         - Format detection based on S3 filename extension
 
         Caching Behavior:
-        - Cached with st.cache_data decorator (TTL: 1 hour)
-        - Cache key includes: source, last_modified timestamp, data_bytes hash, filename
+        - Cached in memory with st.cache_data, keyed by data version
+        - Cache key includes: source, last_modified timestamp, filename
+        - Local Parquet snapshots in data/processed are what survive an app restart
         - Automatic cache invalidation when S3 file is updated
         - Manual refresh available via refresh_data_cache()
 
@@ -656,9 +1016,7 @@ class DataIngestionManager:
             pd.DataFrame with the requested data cached in st.cache_data (may be empty on failure)
         """
         # Check if S3 is configured
-        from src.utils.config import is_api_enabled
-
-        if not is_api_enabled("s3"):
+        if not config.is_api_enabled("s3"):
             error_msg = (
                 "⚠️ S3 is not configured — using local cache files as fallback.\n\n"
                 "**For production use**, configure S3 credentials in `.streamlit/secrets.toml`:\n"
@@ -684,15 +1042,8 @@ class DataIngestionManager:
         if show_status:
             logger.debug(f"Loading data for {source.value} from S3")
 
-        # Use the cached processing method
-        df = self._load_and_process_data(source)
-
-        # Apply any additional post-processing if needed
-        if source == DataSource.PROVIDER_DATA and not df.empty:
-            # Ensure provider aggregation is applied
-            df = self._process_provider_data(df)
-
-        return df
+        # Use the cached processing method; provider data comes back already aggregated
+        return self._load_and_process_data(source)
 
     def validate_data_integrity(self, source: DataSource) -> Dict[str, Union[bool, str, int, float, list]]:
         """
@@ -704,13 +1055,30 @@ class DataIngestionManager:
         - Data type validation
         - Missing value analysis
 
+        When required columns are missing the report is returned as invalid without
+        scanning the data, so its duplicate, coordinate, and missing-value stats are 0.
+
+        Results are cached per data version for up to an hour, matching the data cache, so
+        repeated renders of the admin pages do not rescan the data while a new upload or
+        regenerated parquet file gets a fresh report; refresh_data_cache() clears them.
+
         Args:
             source: Data source to validate
 
         Returns:
             Dictionary with validation results
         """
-        df = self.load_data(source, show_status=False)
+        return self._validate_data_integrity_cached(source, self._source_version(source))
+
+    @st.cache_data(ttl=3600, show_spinner=False)
+    def _validate_data_integrity_cached(
+        _self, source: DataSource, version: Tuple[str, str, str]
+    ) -> Dict[str, Union[bool, str, int, float, list]]:
+        """Load a source and compute its validation report for validate_data_integrity.
+
+        ``version`` is only part of the cache key, so a report is recomputed for new data.
+        """
+        df = _self.load_data(source, show_status=False)
 
         if df.empty:
             return {
@@ -720,34 +1088,48 @@ class DataIngestionManager:
                 "column_count": 0,
             }
 
-        # Define required columns based on data source
-        if source == DataSource.PROVIDER_DATA:
-            required_cols = ["Full Name", "Referral Count"]
-        else:
-            required_cols = ["Full Name", "Project ID"]
-
-        missing_cols = [col for col in required_cols if col not in df.columns]
+        required_cols = _REQUIRED_COLUMNS.get(source, _DEFAULT_REQUIRED_COLUMNS)
+        df_cols = set(df.columns)
+        missing_cols = [col for col in required_cols if col not in df_cols]
+        if missing_cols:
+            # The report is invalid regardless of the data, so skip the full-frame scans
+            return {
+                "valid": False,
+                "row_count": len(df),
+                "column_count": len(df.columns),
+                "missing_required_columns": missing_cols,
+                "duplicate_names": 0,
+                "invalid_coordinates": 0,
+                "missing_values_pct": 0,
+            }
 
-        # Coordinate validation for provider data
-        coord_issues = 0
-        if "Latitude" in df.columns and "Longitude" in df.columns:
-            invalid_coords = (
-                pd.notna(df["Latitude"])
-                & pd.notna(df["Longitude"])
-                & ((df["Latitude"] < -90) | (df["Latitude"] > 90) | (df["Longitude"] < -180) | (df["Longitude"] > 180))
-            )
-            coord_issues = invalid_coords.sum()
+        # One pass over the columns gathers every reduction; bounded columns are converted
+        # to float once and that array serves both their missing count and bounds check
+        missing_cells = 0
+        duplicate_names = 0
+        out_of_bounds = np.zeros(len(df), dtype=bool)
+        for col, values in df.items():
+            bounds = _VALUE_BOUNDS.get(col)
+            if bounds is None:
+                missing_cells += int(values.isna().sum())
+            else:
+                # NaN compares False, so missing values are not counted without notna masks
+                array = values.to_numpy(dtype="float64", na_value=np.nan)
+                missing_cells += int(np.count_nonzero(np.isnan(array)))
+                # In-place ORs keep one boolean temporary alive at a time
+                out_of_bounds |= array < bounds[0]
+                out_of_bounds |= array > bounds[1]
+            if col == "Full Name":
+                duplicate_names = _count_duplicates(values)
 
         return {
-            "valid": len(missing_cols) == 0,
+            "valid": True,
             "row_count": len(df),
             "column_count": len(df.columns),
             "missing_required_columns": missing_cols,
-            "duplicate_names": df["Full Name"].duplicated().sum() if "Full Name" in df.columns else 0,
-            "invalid_coordinates": coord_issues,
-            "missing_values_pct": (
-                round((df.isnull().sum().sum() / (len(df) * len(df.columns)) * 100), 2) if not df.empty else 0
-            ),
+            "duplicate_names": duplicate_names,
+            "invalid_coordinates": int(np.count_nonzero(out_of_bounds)),
+            "missing_values_pct": round(missing_cells / df.size * 100, 2) if df.size else 0,
         }
 
     def preload_data(self) -> None:
@@ -763,7 +1145,20 @@ class DataIngestionManager:
         - Downloads latest CSV/Excel files from S3
         - Processes and transforms data once
         - Stores in Streamlit cache for fast subsequent access
+
+        Every session starts the background ETL, so the preload runs once per cache
+        generation: concurrent callers wait for the running preload, and later calls
+        return immediately until refresh_data_cache clears the caches again.
         """
+        with _preload_lock:
+            if _preload_done.is_set():
+                logger.debug("Critical data sources already preloaded")
+                return
+            if self._preload_critical_sources():
+                _preload_done.set()
+
+    def _preload_critical_sources(self) -> bool:
+        """Load the critical sources concurrently; True if any of them loaded."""
         logger.info("Preloading data from S3 into Streamlit cache...")
 
         # Load the most critical data sources that are used across the app
@@ -773,71 +1168,72 @@ class DataIngestionManager:
             DataSource.PROVIDER_DATA,
         ]
 
+        # Loads are dominated by S3 latency and parsing, so run them concurrently; the shared
+        # S3 batch download is cached per key, so the sources still reuse one set of downloads
         loaded_sources = []
-        for source in critical_sources:
-            try:
-                df = self.load_data(source, show_status=False)
-                if not df.empty:
-                    loaded_sources.append(source.value)
-                    logger.info(f"Preloaded {source.value}: {len(df)} records")
-                else:
-                    logger.warning(f"Failed to preload {source.value}: empty dataset")
-            except Exception as e:
-                logger.error(f"Failed to preload {source.value}: {e}")
+        with ThreadPoolExecutor(max_workers=len(critical_sources)) as executor:
+            futures = {
+                executor.submit(self.load_data, source, show_status=False): source for source in critical_sources
+            }
+            for future in as_completed(futures):
+                source = futures[future]
+                try:
+                    df = future.result()
+                    if not df.empty:
+                        loaded_sources.append(source.value)
+                        logger.info("Preloaded %s: %d records", source.value, len(df))
+                    else:
+                        logger.warning("Failed to preload %s: empty dataset", source.value)
+                except Exception as e:
+                    logger.error("Failed to preload %s: %s", source.value, e)
 
         if loaded_sources:
-            logger.info(f"Successfully preloaded data sources: {', '.join(loaded_sources)}")
-        else:
-            logger.warning("No data sources were successfully preloaded")
+            if logger.isEnabledFor(logging.INFO):
+                logger.info("Successfully preloaded data sources: %s", ", ".join(loaded_sources))
+            return True
+        logger.warning("No data sources were successfully preloaded")
+        return False
 
     def check_and_refresh_daily_cache(self) -> bool:
         """
         Check if it's time for daily cache refresh (4 AM) and refresh if needed.
 
-        This method checks the current time and compares it to the last refresh time.
-        If it's after 4 AM and we haven't refreshed today, it clears the cache
-        to force fresh downloads from S3.
+        Each day's refresh period starts at 4 AM. The first check of a process only
+        records the current period: a new process starts with empty in-memory caches,
+        and its loads come from the Parquet snapshots of the current S3 versions. Later,
+        the first check in a new period clears the in-memory caches and preloads the
+        critical sources; every other check is a date comparison against the period
+        already refreshed, shared by all sessions of the process. The snapshots are
+        never removed by the refresh.
 
         Returns:
             True if cache was refreshed, False otherwise
         """
-        from datetime import datetime, time
+        global _last_daily_refresh_period
 
-        # Get current time
         now = datetime.now()
-        current_time = now.time()
-        today = now.date()
-
-        # Check if it's after 4 AM
-        refresh_time = time(4, 0, 0)  # 4:00 AM
-        is_after_refresh_time = current_time >= refresh_time
-
-        # Get the last refresh date from session state or cache
-        last_refresh_key = "last_daily_refresh_date"
-        last_refresh_date = st.session_state.get(last_refresh_key)
+        period = (now - timedelta(hours=_DAILY_REFRESH_HOUR)).date()
 
-        # If no last refresh date or it's a different day and after 4 AM, refresh
-        should_refresh = (last_refresh_date is None or last_refresh_date != today) and is_after_refresh_time
-
-        if should_refresh:
-            logger.info(f"Performing daily cache refresh at {now.strftime('%Y-%m-%d %H:%M:%S')}")
-            try:
-                # Clear the cache to force fresh downloads
-                refresh_data_cache()
-
-                # Update the last refresh date
-                st.session_state[last_refresh_key] = today
+        with _daily_refresh_lock:
+            if _last_daily_refresh_period == period:
+                logger.debug("Daily cache refresh not needed at this time")
+                return False
+            # A fresh process has nothing cached in memory yet, so it only seeds the period
+            first_check = _last_daily_refresh_period is None
+            _last_daily_refresh_period = period
+            if first_check:
+                return False
 
-                # Preload data again after cache clear
-                self.preload_data()
+        logger.info(f"Performing daily cache refresh at {now.strftime('%Y-%m-%d %H:%M:%S')}")
+        try:
+            # Clear the cache to force fresh downloads, then preload data again
+            refresh_data_cache()
+            self.preload_data()
 
-                logger.info("Daily cache refresh completed successfully")
-                return True
-            except Exception as e:
-                logger.error(f"Failed to perform daily cache refresh: {e}")
-                return False
-        else:
-            logger.debug("Daily cache refresh not needed at this time")
+            logger.info("Daily cache refresh completed successfully")
+            return True
+        except Exception as e:
+            logger.error(f"Failed to perform daily cache refresh: {e}")
             return False
 
 
@@ -866,11 +1262,16 @@ def get_data_manager() -> DataIngestionManager:
 # Backwards-compatible module-level symbol for older imports. This proxy
 # delegates attribute access to the lazily-created DataIngestionManager
 # instance so 'from src.data.ingestion import data_manager' continues to work
-# without reintroducing eager instantiation side-effects.
+# without reintroducing eager instantiation side-effects. Bound methods are cached on
+# the proxy after first use, so later lookups are plain instance-dict hits; other
+# attributes are always read live from the manager.
 class _DataManagerProxy:
     def __getattr__(self, name: str):
         manager = get_data_manager()
-        return getattr(manager, name)
+        attr = getattr(manager, name)
+        if callable(attr):
+            object.__setattr__(self, name, attr)
+        return attr
 
 
 # Exported symbol (keeps older import paths working)
@@ -886,6 +1287,21 @@ data_manager = _DataManagerProxy()
 
 
 @st.cache_data(ttl=3600, show_spinner=False)
+def _load_source_cached(source: DataSource, version: Tuple[str, str, str]) -> pd.DataFrame:
+    """Load a source for the compatibility loaders; version is part of the cache key only."""
+    return get_data_manager().load_data(source, show_status=False)
+
+
+def _load_source(source: DataSource) -> pd.DataFrame:
+    """
+    Load a source through the shared Streamlit cache, keyed by its current data version.
+
+    A new S3 upload (or a rewritten local parquet file) changes the key, so callers get
+    the new data without waiting for the hour-long entry to expire or a manual refresh.
+    """
+    return _load_source_cached(source, get_data_manager()._source_version(source))
+
+
 def load_detailed_referrals(filepath: Optional[str] = None) -> pd.DataFrame:
     """
     Load detailed referral data (outbound referrals) from S3 into Streamlit cache.
@@ -902,10 +1318,9 @@ def load_detailed_referrals(filepath: Optional[str] = None) -> pd.DataFrame:
     Returns:
         DataFrame with outbound referral data cached in st.cache_data
     """
-    return get_data_manager().load_data(DataSource.OUTBOUND_REFERRALS, show_status=False)
+    return _load_source(DataSource.OUTBOUND_REFERRALS)
 
 
-@st.cache_data(ttl=3600, show_spinner=False)
 def load_inbound_referrals(filepath: Optional[str] = None) -> pd.DataFrame:
     """
     Load inbound referral data from S3 into Streamlit cache.
@@ -922,10 +1337,9 @@ def load_inbound_referrals(filepath: Optional[str] = None) -> pd.DataFrame:
     Returns:
         DataFrame with inbound referral data cached in st.cache_data
     """
-    return get_data_manager().load_data(DataSource.INBOUND_REFERRALS, show_status=False)
+    return _load_source(DataSource.INBOUND_REFERRALS)
 
 
-@st.cache_data(ttl=3600, show_spinner=False)
 def load_provider_data(filepath: Optional[str] = None) -> pd.DataFrame:
     """
     Load provider data with referral counts from S3 into Streamlit cache.
@@ -942,10 +1356,9 @@ def load_provider_data(filepath: Optional[str] = None) -> pd.DataFrame:
     Returns:
         DataFrame with unique providers and referral counts cached in st.cache_data
     """
-    return get_data_manager().load_data(DataSource.PROVIDER_DATA, show_status=False)
+    return _load_source(DataSource.PROVIDER_DATA)
 
 
-@st.cache_data(ttl=3600, show_spinner=False)
 def load_all_referrals(filepath: Optional[str] = None) -> pd.DataFrame:
     """
     Load combined referral data (inbound + outbound) from S3 into Streamlit cache.
@@ -961,10 +1374,9 @@ def load_all_referrals(filepath: Optional[str] = None) -> pd.DataFrame:
     Returns:
         DataFrame with all referral data combined, cached in st.cache_data
     """
-    return get_data_manager().load_data(DataSource.ALL_REFERRALS, show_status=False)
+    return _load_source(DataSource.ALL_REFERRALS)
 
 
-@st.cache_data(ttl=3600, show_spinner=False)
 def load_preferred_providers(filepath: Optional[str] = None) -> pd.DataFrame:
     """
     Load preferred providers contact data from S3 into Streamlit cache.
@@ -978,7 +1390,7 @@ def load_preferred_providers(filepath: Optional[str] = None) -> pd.DataFrame:
     Returns:
         DataFrame with preferred provider contact information cached in st.cache_data
     """
-    return get_data_manager().load_data(DataSource.PREFERRED_PROVIDERS, show_status=False)
+    return _load_source(DataSource.PREFERRED_PROVIDERS)
 
 
 # ============================================================================
@@ -986,14 +1398,40 @@ def load_preferred_providers(filepath: Optional[str] = None) -> pd.DataFrame:
 # ============================================================================
 
 
-def get_data_ingestion_status() -> Dict[str, Dict[str, Union[bool, str]]]:
+def get_ingestion_stats() -> Dict[str, Dict[str, Union[int, float]]]:
+    """
+    Get load counters for every data source loaded by this process.
+
+    Returns:
+        Dictionary mapping source names to their memo ``hits``, ``misses`` (loads served by
+        the Streamlit cache, a snapshot, a download, or local parquet) and ``last_load_ms``
+    """
+    with _ingestion_stats_lock:
+        return {source: dict(stats) for source, stats in _ingestion_stats.items()}
+
+
+def get_data_version() -> Tuple[Tuple[str, str, str], ...]:
+    """
+    Identify the current data of every source without loading it.
+
+    Returns:
+        One ``(origin, file, modified)`` tuple per DataSource; the value changes whenever
+        a newer S3 upload or local parquet file would be loaded.
+    """
+    manager = get_data_manager()
+    return tuple(manager._source_version(source) for source in DataSource)
+
+
+def get_data_ingestion_status() -> Dict[str, Dict[str, Union[bool, str, int, float]]]:
     """
     Get comprehensive status of all data ingestion sources.
 
     Returns:
-        Status dictionary with availability and optimization info for each source
+        Status dictionary with availability and optimization info for each source, plus
+        its get_ingestion_stats counters once the source has been loaded
     """
-    return get_data_manager().get_data_status()
+    stats = get_ingestion_stats()
+    return {source: {**info, **stats.get(source, {})} for source, info in get_data_manager().get_data_status().items()}
 
 
 def refresh_data_cache():
@@ -1010,9 +1448,13 @@ def refresh_data_cache():
     - Manual cache refresh requested by user
 
     Cache Clearing Strategy:
-    - Clears st.cache_data (DataFrames, processed data)
+    - Clears st.cache_data (DataFrames, processed data); every st.cache_data cache in
+      the app is in memory, so nothing is removed from disk
     - Clears st.cache_resource (S3 client connections, sessions)
-    - Next data load will re-download from S3 and rebuild cache
+    - Clears the in-process memo of processed DataFrames
+    - Re-arms preload_data so the next preload warms the emptied caches
+    - Keeps the Parquet snapshots in data/processed, so the next load of an unchanged
+      S3 version reads its snapshot instead of downloading and re-parsing the file
     """
     # Clear cached data (dataframes, downloads) and cached resources
     # (client instances, sessions). This ensures that the app will reload
@@ -1026,6 +1468,8 @@ def refresh_data_cache():
         st.cache_resource.clear()
     except Exception:
         pass
+    _clear_processed_memo()
+    _preload_done.clear()
     logger.info("Data cache cleared - next loads will fetch fresh CSV/Excel data from S3")
 
 
@@ -1036,15 +1480,23 @@ def validate_all_data_sources() -> Dict[str, Dict[str, Union[bool, str, int, flo
     Returns:
         Validation results for each data source
     """
+    manager = get_data_manager()
+    sources = list(DataSource)
     results = {}
-    for source in DataSource:
-        try:
-            results[source.value] = get_data_manager().validate_data_integrity(source)
-        except Exception as e:
-            results[source.value] = {
-                "valid": False,
-                "error": str(e),
-                "row_count": 0,
-                "column_count": 0,
-            }
-    return results
+    # Each validation loads its source (S3 download + parse), so validate all sources concurrently;
+    # the referral sources share a single parse of their file
+    with ThreadPoolExecutor(max_workers=min(len(sources), 8)) as executor:
+        futures = {executor.submit(manager.validate_data_integrity, source): source for source in sources}
+        for future in as_completed(futures):
+            source = futures[future]
+            try:
+                results[source.value] = future.result()
+            except Exception as e:
+                results[source.value] = {
+                    "valid": False,
+                    "error": str(e),
+                    "row_count": 0,
+                    "column_count": 0,
+                }
+    # Report sources in enum order regardless of completion order
+    return {source.value: results[source.value] for source in sources}
@@ -8,6 +8,8 @@ data formats (CSV, Excel, Parquet, in-memory buffers).
 Key Functions:
 - detect_file_format: Determine file format from filename or bytes
 - load_dataframe: Universal data loader supporting multiple input types
+- read_csv: Multithreaded CSV parser with a pandas fallback
+- arrow_string_dtype: Arrow-to-pandas type mapper keeping text Arrow-backed
 - looks_like_excel_bytes: Quick heuristic to detect Excel file format
 
 Supported Formats:
@@ -20,15 +22,27 @@ Supported Formats:
 
 from __future__ import annotations
 
+import csv
+import importlib.util
 import logging
 from io import BytesIO
 from pathlib import Path
-from typing import Any, Optional, Union
+from typing import Any, Callable, Optional, Union
 
 import pandas as pd
+import pyarrow as pa
+import pyarrow.csv as pa_csv
 
 logger = logging.getLogger(__name__)
 
+# Read CSVs in 8 MiB blocks across threads; column types are inferred from the first block
+_CSV_READ_OPTIONS = pa_csv.ReadOptions(use_threads=True, block_size=8 << 20)
+_CSV_CONVERT_OPTIONS = pa_csv.ConvertOptions(strings_can_be_null=True)
+
+# python-calamine (Rust) parses .xlsx/.xls far faster and with less memory than openpyxl;
+# it is optional, and openpyxl/xlrd remain the fallback engines.
+CALAMINE_AVAILABLE = importlib.util.find_spec("python_calamine") is not None
+
 
 def looks_like_excel_bytes(buffer: BytesIO) -> bool:
     """Quick heuristic: check first bytes to see if data looks like an Excel file.
@@ -151,18 +165,19 @@ def load_dataframe(
 
         # Load based on format
         if format_type == "csv":
-            df = pd.read_csv(raw_path)
+            df = read_csv(raw_path)
         elif format_type == "parquet":
             df = pd.read_parquet(raw_path)
         else:
             # Excel or unknown format - try Excel first with fallback to CSV
             try:
-                if engine:
+                df = _read_excel_calamine(raw_path, sheet_name)
+                if df is None and engine:
                     if sheet_name:
                         df = pd.read_excel(raw_path, sheet_name=sheet_name, engine=engine)
                     else:
                         df = pd.read_excel(raw_path, engine=engine)
-                else:
+                elif df is None:
                     # Try openpyxl first, then xlrd
                     try:
                         if sheet_name:
@@ -211,7 +226,7 @@ def load_dataframe(
         if format_type == "csv":
             # CSV format (preferred)
             try:
-                df = pd.read_csv(buffer)
+                df = read_csv(buffer)
             except Exception:
                 # Fallback to Excel if CSV parsing fails
                 buffer.seek(0)
@@ -232,6 +247,99 @@ def load_dataframe(
         return df
 
 
+def arrow_string_dtype(pa_type: pa.DataType) -> Optional[pd.api.extensions.ExtensionDtype]:
+    """Map Arrow string columns to pandas' Arrow-backed string dtype when converting tables.
+
+    Keeps text in contiguous UTF-8 buffers so ``.str`` operations run on Arrow compute
+    instead of Python objects. Other types fall through to the default conversion.
+    """
+    if pa.types.is_string(pa_type) or pa.types.is_large_string(pa_type):
+        return pd.StringDtype("pyarrow")
+    return None
+
+
+def _csv_header(source: Union[Path, BytesIO]) -> list[str]:
+    """Column names from the first line of CSV data; a buffer is left where it was."""
+    if isinstance(source, BytesIO):
+        start = source.tell()
+        line = source.readline()
+        source.seek(start)
+    else:
+        with open(source, "rb") as handle:
+            line = handle.readline()
+    return next(csv.reader([line.decode("utf-8-sig", errors="replace")]), [])
+
+
+def read_csv(source: Union[Path, BytesIO], usecols: Optional[Callable[[Any], bool]] = None) -> pd.DataFrame:
+    """Parse CSV with pyarrow's multithreaded reader, falling back to pandas.
+
+    The pandas parser is used when pyarrow rejects the file, e.g. a column whose
+    values stop matching the type inferred from the first block, or duplicate headers.
+
+    Args:
+        source: File path or BytesIO buffer positioned at the start of the CSV data
+        usecols: Optional column-name filter, as accepted by pd.read_csv; columns it
+            rejects are skipped by pyarrow's type conversion rather than parsed and dropped
+
+    Returns:
+        pd.DataFrame parsed from the CSV data
+    """
+    convert_options = _CSV_CONVERT_OPTIONS
+    if usecols is not None:
+        header = _csv_header(source)
+        # Duplicate names are left for the duplicate-header check below
+        if len(set(header)) == len(header):
+            convert_options = pa_csv.ConvertOptions(
+                strings_can_be_null=True, include_columns=[name for name in header if usecols(name)]
+            )
+    try:
+        table = pa_csv.read_csv(source, read_options=_CSV_READ_OPTIONS, convert_options=convert_options)
+        if len(set(table.column_names)) == len(table.column_names):
+            if usecols is not None:
+                table = table.select([name for name in table.column_names if usecols(name)])
+            # Text stays in Arrow buffers instead of being materialized as Python strings, and
+            # the table frees each column as pandas takes it over so large files are not held twice
+            df = table.to_pandas(types_mapper=arrow_string_dtype, self_destruct=True)
+            del table
+            return df
+        logger.debug("CSV has duplicate column names; parsing with pandas")
+    except (pa.ArrowInvalid, pa.ArrowKeyError, pa.ArrowNotImplementedError) as e:
+        logger.debug("pyarrow CSV parse failed (%s); parsing with pandas", e)
+
+    if isinstance(source, BytesIO):
+        source.seek(0)
+    return pd.read_csv(source, usecols=usecols)
+
+
+def _read_excel_calamine(source: Union[Path, BytesIO], sheet_name: Optional[str]) -> Optional[pd.DataFrame]:
+    """Read Excel data with the calamine engine when it is installed.
+
+    Mirrors the sheet handling of the other engines: a missing ``sheet_name``
+    falls back to the first sheet.
+
+    Args:
+        source: File path or BytesIO buffer containing Excel data
+        sheet_name: Optional sheet name to read
+
+    Returns:
+        pd.DataFrame, or None when calamine is unavailable or cannot read the data
+    """
+    if not CALAMINE_AVAILABLE:
+        return None
+    try:
+        if sheet_name:
+            try:
+                return pd.read_excel(source, sheet_name=sheet_name, engine="calamine")
+            except (ValueError, KeyError):
+                # Sheet not found, use the default sheet
+                if isinstance(source, BytesIO):
+                    source.seek(0)
+        return pd.read_excel(source, engine="calamine")
+    except Exception as e:
+        logger.debug("calamine could not read Excel data (%s); using openpyxl/xlrd", e)
+        return None
+
+
 def _load_excel_from_buffer(buffer: BytesIO, sheet_name: Optional[str], engine: Optional[str]) -> pd.DataFrame:
     """Helper to load Excel data from buffer with fallback logic.
 
@@ -246,6 +354,11 @@ def _load_excel_from_buffer(buffer: BytesIO, sheet_name: Optional[str], engine:
     Raises:
         Exception: If all Excel loading attempts fail
     """
+    df = _read_excel_calamine(buffer, sheet_name)
+    if df is not None:
+        return df
+    buffer.seek(0)
+
     # Try with sheet name first
     if sheet_name:
         try:
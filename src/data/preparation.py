@@ -27,7 +27,7 @@ import numpy as np
 import pandas as pd
 
 # Import shared I/O utilities
-from src.data.io_utils import load_dataframe
+from src.data.io_utils import load_dataframe, read_csv
 from src.data.io_utils import looks_like_excel_bytes as _looks_like_excel_bytes
 
 logger = logging.getLogger(__name__)
@@ -195,15 +195,18 @@ def _normalize_date_series(series: pd.Series) -> pd.Series:
 
 
 def _select_and_rename(df: pd.DataFrame, column_mapping: Mapping[str, str]) -> tuple[pd.DataFrame, List[str]]:
-    selected = pd.DataFrame(index=df.index)
+    # Gather the columns and build the frame once; inserting them one at a time into an
+    # empty frame reallocated its block layout for every column
+    df_cols = set(df.columns)
+    columns: Dict[str, pd.Series] = {}
     missing_sources: List[str] = []
     for source_col, target_col in column_mapping.items():
-        if source_col in df.columns:
-            selected[target_col] = df[source_col]
+        if source_col in df_cols:
+            columns[target_col] = df[source_col]
         else:
-            selected[target_col] = pd.Series(pd.NA, index=df.index)
+            columns[target_col] = pd.Series(pd.NA, index=df.index, dtype=object)
             missing_sources.append(source_col)
-    return selected, missing_sources
+    return pd.DataFrame(columns, index=df.index, copy=False), missing_sources
 
 
 def _clean_referral_frame(df: pd.DataFrame) -> pd.DataFrame:
@@ -327,6 +330,17 @@ _REFERRAL_CONFIGS: Dict[str, Dict[str, Any]] = {
 }
 
 
+# Raw export columns read by any referral config, plus Create Date for date backfilling
+_REFERRAL_INPUT_COLUMNS = frozenset(
+    {column for config in _REFERRAL_CONFIGS.values() for column in config["columns"]} | {"Create Date"}
+)
+
+
+def _is_referral_input_column(name: Any) -> bool:
+    """Column filter for readers; names are stripped as they are after loading."""
+    return str(name).strip() in _REFERRAL_INPUT_COLUMNS
+
+
 # NOTE: This function definition was removed as it was a duplicate of the more
 # complete implementation below (starting at line 785). The duplicate caused
 # confusion and the first definition was being overridden by the second anyway.
@@ -522,7 +536,7 @@ def process_and_save_cleaned_referrals(
         tried_csv = False
         if is_csv_file:
             try:
-                df_all = pd.read_csv(excel_buffer)
+                df_all = read_csv(excel_buffer)
                 tried_csv = True
             except Exception:
                 excel_buffer.seek(0)
@@ -541,7 +555,7 @@ def process_and_save_cleaned_referrals(
                 excel_error = e
                 try:
                     excel_buffer.seek(0)
-                    df_all = pd.read_csv(excel_buffer)
+                    df_all = read_csv(excel_buffer)
                 except Exception as e2:
                     csv_error = e2
                     # As a last resort try reading Excel without sheet name which may work for single-sheet files
@@ -585,7 +599,7 @@ def process_and_save_cleaned_referrals(
                 engine = "xlrd"
 
             if suffix == ".csv":
-                df_all = pd.read_csv(raw_path)
+                df_all = read_csv(raw_path)
             else:
                 # Try Excel first; if it fails, attempt CSV fallback (some exports are CSV without .csv extension)
                 try:
@@ -600,7 +614,7 @@ def process_and_save_cleaned_referrals(
                             df_all = pd.read_excel(raw_path, sheet_name="Referrals_App_Full_Contacts", engine="xlrd")
                 except Exception:
                     try:
-                        df_all = pd.read_csv(raw_path)
+                        df_all = read_csv(raw_path)
                     except Exception:
                         # Final fallback: try read_excel without sheet
                         if engine:
@@ -708,9 +722,9 @@ def process_and_save_cleaned_referrals(
             except PermissionError:
                 logger.warning("Could not remove existing file (locked): %s", path)
 
-    _safe_to_parquet(inbound_combined, inbound_path, compression="snappy")
-    _safe_to_parquet(outbound, outbound_path, compression="snappy")
-    _safe_to_parquet(combined, all_path, compression="snappy")
+    _safe_to_parquet(inbound_combined, inbound_path, compression="zstd")
+    _safe_to_parquet(outbound, outbound_path, compression="zstd")
+    _safe_to_parquet(combined, all_path, compression="zstd")
 
     saved_files.update({"inbound": inbound_path, "outbound": outbound_path, "all": all_path})
 
@@ -760,6 +774,7 @@ def process_referral_data(
     raw_input: Union[Path, str, BytesIO, bytes, BinaryIO, pd.DataFrame, Any],
     *,
     filename: Optional[str] = None,
+    project_columns: bool = False,
 ) -> tuple[pd.DataFrame, pd.DataFrame, pd.DataFrame, PreparationSummary]:
     """Process referral data and return DataFrames without saving to disk.
 
@@ -769,12 +784,16 @@ def process_referral_data(
     Args:
         raw_input: Same input types as process_and_save_cleaned_referrals
         filename: Optional filename for logging (used with BytesIO/bytes/DataFrame inputs)
+        project_columns: If True, file readers parse only the columns the referral configs
+            consume, skipping the rest of wide exports. DataFrame inputs are used as given.
 
     Returns:
         Tuple of (inbound_df, outbound_df, combined_df, summary) containing processed data
     """
     import tempfile
 
+    usecols = _is_referral_input_column if project_columns else None
+
     # Use a temporary directory that we won't actually write to
     with tempfile.TemporaryDirectory():
         # Process the data but capture DataFrames before they're saved
@@ -828,48 +847,58 @@ def process_referral_data(
             # Try to read as CSV first if filename suggests it
             if is_csv_file:
                 try:
-                    df_all = pd.read_csv(excel_buffer)
+                    df_all = read_csv(excel_buffer, usecols=usecols)
                 except Exception:
                     # Fall back to Excel
                     excel_buffer.seek(0)
                     if engine:
-                        df_all = pd.read_excel(excel_buffer, sheet_name="Referrals_App_Full_Contacts", engine=engine)
+                        df_all = pd.read_excel(
+                            excel_buffer, sheet_name="Referrals_App_Full_Contacts", engine=engine, usecols=usecols
+                        )
                     else:
                         try:
                             df_all = pd.read_excel(
-                                excel_buffer, sheet_name="Referrals_App_Full_Contacts", engine="openpyxl"
+                                excel_buffer,
+                                sheet_name="Referrals_App_Full_Contacts",
+                                engine="openpyxl",
+                                usecols=usecols,
                             )
                         except Exception:
                             excel_buffer.seek(0)
                             df_all = pd.read_excel(
-                                excel_buffer, sheet_name="Referrals_App_Full_Contacts", engine="xlrd"
+                                excel_buffer, sheet_name="Referrals_App_Full_Contacts", engine="xlrd", usecols=usecols
                             )
             else:
                 # Try Excel first
                 try:
                     if engine:
-                        df_all = pd.read_excel(excel_buffer, sheet_name="Referrals_App_Full_Contacts", engine=engine)
+                        df_all = pd.read_excel(
+                            excel_buffer, sheet_name="Referrals_App_Full_Contacts", engine=engine, usecols=usecols
+                        )
                     else:
                         try:
                             df_all = pd.read_excel(
-                                excel_buffer, sheet_name="Referrals_App_Full_Contacts", engine="openpyxl"
+                                excel_buffer,
+                                sheet_name="Referrals_App_Full_Contacts",
+                                engine="openpyxl",
+                                usecols=usecols,
                             )
                         except Exception:
                             excel_buffer.seek(0)
                             df_all = pd.read_excel(
-                                excel_buffer, sheet_name="Referrals_App_Full_Contacts", engine="xlrd"
+                                excel_buffer, sheet_name="Referrals_App_Full_Contacts", engine="xlrd", usecols=usecols
                             )
                 except ValueError:
                     # Reset position and try again without sheet name
                     excel_buffer.seek(0)
                     if engine:
-                        df_all = pd.read_excel(excel_buffer, engine=engine)
+                        df_all = pd.read_excel(excel_buffer, engine=engine, usecols=usecols)
                     else:
                         try:
-                            df_all = pd.read_excel(excel_buffer, engine="openpyxl")
+                            df_all = pd.read_excel(excel_buffer, engine="openpyxl", usecols=usecols)
                         except Exception:
                             excel_buffer.seek(0)
-                            df_all = pd.read_excel(excel_buffer, engine="xlrd")
+                            df_all = pd.read_excel(excel_buffer, engine="xlrd", usecols=usecols)
             # Normalize column names (strip whitespace)
             df_all.columns = df_all.columns.str.strip()
         else:
@@ -889,28 +918,33 @@ def process_referral_data(
                     engine = "xlrd"
 
                 if suffix == ".csv":
-                    df_all = pd.read_csv(raw_path)
+                    df_all = read_csv(raw_path, usecols=usecols)
                 else:
                     try:
                         if engine:
-                            df_all = pd.read_excel(raw_path, sheet_name="Referrals_App_Full_Contacts", engine=engine)
+                            df_all = pd.read_excel(
+                                raw_path, sheet_name="Referrals_App_Full_Contacts", engine=engine, usecols=usecols
+                            )
                         else:
                             try:
                                 df_all = pd.read_excel(
-                                    raw_path, sheet_name="Referrals_App_Full_Contacts", engine="openpyxl"
+                                    raw_path,
+                                    sheet_name="Referrals_App_Full_Contacts",
+                                    engine="openpyxl",
+                                    usecols=usecols,
                                 )
                             except Exception:
                                 df_all = pd.read_excel(
-                                    raw_path, sheet_name="Referrals_App_Full_Contacts", engine="xlrd"
+                                    raw_path, sheet_name="Referrals_App_Full_Contacts", engine="xlrd", usecols=usecols
                                 )
                     except ValueError:
                         if engine:
-                            df_all = pd.read_excel(raw_path, engine=engine)
+                            df_all = pd.read_excel(raw_path, engine=engine, usecols=usecols)
                         else:
                             try:
-                                df_all = pd.read_excel(raw_path, engine="openpyxl")
+                                df_all = pd.read_excel(raw_path, engine="openpyxl", usecols=usecols)
                             except Exception:
-                                df_all = pd.read_excel(raw_path, engine="xlrd")
+                                df_all = pd.read_excel(raw_path, engine="xlrd", usecols=usecols)
                 # Normalize column names (strip whitespace)
                 df_all.columns = df_all.columns.str.strip()
             else:
@@ -1084,7 +1118,7 @@ def process_and_save_preferred_providers(
         except PermissionError:
             logger.warning("Could not remove existing preferred providers file (locked): %s", output_path)
 
-    _safe_to_parquet(df_cleaned, output_path, compression="snappy")
+    _safe_to_parquet(df_cleaned, output_path, compression="zstd")
 
     logger.info(
         "Saved cleaned preferred providers: %d records (dropped %d missing geo data)",
@@ -5,6 +5,13 @@ from typing import Any
 import pandas as pd
 import streamlit as st
 
+from src.data.io_utils import read_csv
+
+# Renderings astype(str) leaves for missing values: "nan"/"None" from NumPy and object
+# columns, "<NA>" from Arrow-backed and nullable columns on pandas 2.x. Shared by every
+# module that blanks missing address text.
+MISSING_TEXT = frozenset({"", "nan", "None", "NaN", "<NA>"})
+
 STATE_MAPPING = {
     "ALABAMA": "AL",
     "ALASKA": "AK",
@@ -68,7 +75,7 @@ def load_provider_data(filepath: str) -> pd.DataFrame:
 
     suffix = path.suffix.lower()
     if suffix == ".csv":
-        df = pd.read_csv(path)
+        df = read_csv(path)
     elif suffix == ".xlsx":
         df = pd.read_excel(path)
     elif suffix == ".feather":
@@ -81,10 +88,11 @@ def load_provider_data(filepath: str) -> pd.DataFrame:
     df.columns = [col.strip() for col in df.columns]
     df = df.drop(columns="Preference", errors="ignore")
 
-    # Ensure address columns are strings
-    for col in ("Street", "City", "State", "Zip"):
-        if col in df.columns:
-            df[col] = df[col].astype(str).replace(["nan", "None", "NaN"], "").fillna("")
+    # Ensure address columns are strings, with missing values and their renderings as ""
+    address_cols = [col for col in ("Street", "City", "State", "Zip") if col in df.columns]
+    if address_cols:
+        address_text = df[address_cols].astype(str)
+        df[address_cols] = address_text.mask(address_text.isna() | address_text.isin(MISSING_TEXT), "")
 
     if "Referral Count" in df.columns:
         df["Referral Count"] = pd.to_numeric(df["Referral Count"], errors="coerce")
@@ -115,8 +123,9 @@ def clean_address_data(df: pd.DataFrame) -> pd.DataFrame:
     df = df.copy()
     for col in ("Street", "City", "State", "Zip"):
         if col in df.columns:
-            df[col] = df[col].astype(str).str.strip()
-            df[col] = df[col].replace(["nan", "None", "NaN", ""], pd.NA).fillna("")
+            # One mask over the stripped text blanks missing values and their renderings
+            text = df[col].astype(str).str.strip()
+            df[col] = text.mask(text.isna() | text.isin(MISSING_TEXT), "")
 
     if "State" in df.columns:
         df["State"] = df["State"].str.upper().map(STATE_MAPPING).fillna(df["State"])
@@ -139,7 +148,7 @@ def build_full_address(df: pd.DataFrame) -> pd.DataFrame:
 
     # Helper to detect empty-like values
     def _is_empty_series(s: pd.Series) -> pd.Series:
-        return s.astype(str).fillna("").str.strip().isin(["", "nan", "None", "NaN"]) | s.isna()
+        return s.astype(str).fillna("").str.strip().isin(MISSING_TEXT) | s.isna()
 
     if "Full Address" in df.columns:
         df["Full Address"] = df["Full Address"].astype(str).fillna("").str.strip()
@@ -48,6 +48,31 @@ def format_phone_number(phone):
         return phone
 
 
+def format_phone_series(phones: pd.Series) -> pd.Series:
+    """
+    Vectorized counterpart of format_phone_number for a whole column.
+
+    Formats 10-digit numbers (and 11-digit numbers with a leading 1) as
+    "(XXX) XXX-XXXX" using pandas string operations instead of a per-row
+    Python call. Values that cannot be formatted are returned unchanged and
+    missing values become None.
+
+    Args:
+        phones: Series of phone numbers as float, int, or string
+
+    Returns:
+        Object Series of formatted phone strings
+    """
+    # Drop the ".0" that float-typed numbers pick up when rendered as text
+    text = phones.astype(str).str.replace(r"\.0+$", "", regex=True)
+    digits = text.str.replace(r"\D", "", regex=True).str.replace(r"^1(\d{10})$", r"\1", regex=True)
+    formatted = digits.str.replace(r"^(\d{3})(\d{3})(\d{4})$", r"(\1) \2-\3", regex=True)
+
+    result = phones.astype(object).mask(digits.str.len() == 10, formatted)
+    result[phones.isna()] = None
+    return result
+
+
 def get_word_bytes(best_provider: pd.Series) -> bytes:
     doc = Document()
     doc.add_heading("Recommended Provider", 0)
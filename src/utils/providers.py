@@ -13,7 +13,7 @@ import pandas as pd
 import streamlit as st
 
 from .addressing import validate_address as _validate_address
-from .cleaning import safe_numeric_conversion
+from .cleaning import MISSING_TEXT, safe_numeric_conversion
 from .cleaning import validate_and_clean_coordinates as _validate_and_clean_coordinates
 from .cleaning import validate_provider_data as _validate_provider_data
 try:
@@ -247,8 +247,10 @@ def calculate_inbound_referral_counts(
     # Add Full Address if components are available
     if all(col in inbound_counts.columns for col in ["Street", "City", "State", "Zip"]):
         # Ensure all address columns are strings to prevent concatenation errors
-        for col in ["Street", "City", "State", "Zip"]:
-            inbound_counts[col] = inbound_counts[col].astype(str).replace(["nan", "None", "NaN"], "").fillna("")
+        address_cols = ["Street", "City", "State", "Zip"]
+        address_text = inbound_counts[address_cols].astype(str)
+        missing = address_text.isna() | address_text.isin(MISSING_TEXT)
+        inbound_counts[address_cols] = address_text.mask(missing, "")
 
         inbound_counts["Full Address"] = (
             inbound_counts["Street"].fillna("")
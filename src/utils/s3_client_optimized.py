@@ -11,7 +11,6 @@ This module provides performance-optimized utilities for accessing S3 with:
 import logging
 from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime
-from io import BytesIO
 from typing import Dict, List, Optional, Tuple
 
 import streamlit as st
@@ -255,12 +254,14 @@ class OptimizedS3DataClient:
         return results
 
     def _download_single_file(self, client, bucket_name: str, s3_key: str) -> Optional[bytes]:
-        """Download a single file from S3."""
+        """Download a single file from S3 with one GET request.
+
+        download_fileobj would add a HEAD request and spin up a transfer thread pool for
+        every file; the exports are small enough to read in one stream on the caller's thread.
+        """
         try:
-            buffer = BytesIO()
-            client.download_fileobj(bucket_name, s3_key, buffer)
-            buffer.seek(0)
-            return buffer.getvalue()
+            response = client.get_object(Bucket=bucket_name, Key=s3_key)
+            return response["Body"].read()
         except Exception as e:
             logger.error(f"Failed to download file '{s3_key}': {e}")
             return None
@@ -406,9 +407,9 @@ def get_latest_s3_files_optimized(
         logger.error(f"Failed to compute S3 listing signature: {e}")
         listings = {ft: [] for ft in folder_types}
 
-    # Build a compact signature string from the most relevant metadata. Use
-    # the most-recent file's name and last-modified time per folder.
-    sig_parts: List[str] = []
+    # Build a compact signature from the most relevant metadata: the most-recent
+    # file's name and last-modified time per folder ("" and 0 for empty folders).
+    sig_parts: List[Tuple[str, str, int]] = []
     for ft in folder_types:
         files = listings.get(ft, [])
         if files:
@@ -417,31 +418,48 @@ def get_latest_s3_files_optimized(
                 ts = int(lm.timestamp())
             except Exception:
                 ts = 0
-            sig_parts.append(f"{ft}:{filename}:{ts}")
+            sig_parts.append((ft, filename, ts))
         else:
-            sig_parts.append(f"{ft}::0")
+            sig_parts.append((ft, "", 0))
 
-    signature = "|".join(sig_parts)
+    signature = tuple(sig_parts)
 
     # Delegate to the cached downloader keyed by signature
-    return _download_latest_files_cached(folder_types, folder_map_key, signature)
+    try:
+        return _download_latest_files_cached(folder_types, folder_map_key, signature)
+    except RuntimeError as e:
+        logger.error(str(e))
+        return {ft: None for ft in folder_types}
 
 
-@st.cache_data(ttl=86400, show_spinner=False)
+@st.cache_data(ttl=86400, show_spinner=False, max_entries=8)
 def _download_latest_files_cached(
-    folder_types: List[str], folder_map_key: Optional[str], signature: str
+    folder_types: List[str], folder_map_key: Optional[str], signature: Tuple[Tuple[str, str, int], ...]
 ) -> Dict[str, Optional[Tuple[bytes, str]]]:
-    """Cached heavy download operation keyed by a signature string.
+    """Cached heavy download operation keyed by a signature of the remote files.
 
-    The `signature` parameter should be derived from S3 last-modified
-    timestamps and filenames so that when remote files change the cache key
-    changes and the downloads are refreshed automatically.
+    The `signature` holds one ``(folder_type, filename, last_modified_ts)`` entry per
+    folder, with an empty filename for folders without files, so that when remote
+    files change the cache key changes and the downloads are refreshed automatically.
+
+    The raw file bytes are kept in memory only; processed data is snapshotted as
+    Parquet by the ingestion layer. max_entries bounds the entries left behind by
+    superseded signatures.
+
+    Raises:
+        RuntimeError: If a folder the signature lists a file for fails to download;
+            exceptions are not cached, so the next call retries instead of keeping the gap
     """
     client = get_optimized_s3_client(folder_map_key)
     if not client.is_configured():
         return {ft: None for ft in folder_types}
 
-    return client.download_latest_files_batch(folder_types)
+    results = client.download_latest_files_batch(folder_types)
+    listed = {ft for ft, filename, _ in signature if filename}
+    failed = [ft for ft in folder_types if results.get(ft) is None and ft in listed]
+    if failed:
+        raise RuntimeError(f"S3 download failed for {', '.join(failed)}")
+    return results
 
 
 # Compatibility functions to match the old s3_client interface
@@ -485,9 +503,9 @@ def get_latest_s3_file(folder_type: str, folder_map: Optional[Dict[str, str]] =
             ts = int(latest_lm.timestamp())
         except Exception:
             ts = 0
-        signature = f"{folder_type}:{latest_filename}:{ts}"
+        signature = ((folder_type, latest_filename, ts),)
     else:
-        signature = f"{folder_type}::0"
+        signature = ((folder_type, "", 0),)
 
     # If a caller supplied a folder_map dict (backwards-compatible), we need
     # to provide a stable folder_map_key to the cached downloader. Streamlit's
@@ -508,7 +526,11 @@ def get_latest_s3_file(folder_type: str, folder_map: Optional[Dict[str, str]] =
     elif isinstance(folder_map, str):
         folder_map_key = folder_map
 
-    result = _download_latest_files_cached([folder_type], folder_map_key, signature)
+    try:
+        result = _download_latest_files_cached([folder_type], folder_map_key, signature)
+    except RuntimeError as e:
+        logger.error(str(e))
+        return None
     return result.get(folder_type)
 
 
@@ -5,20 +5,66 @@ import numpy as np
 import pandas as pd
 
 
-def calculate_distances(user_lat: float, user_lon: float, provider_df: pd.DataFrame) -> List[Optional[float]]:
-    lat_arr = np.radians(provider_df["Latitude"].to_numpy(dtype=float))
-    lon_arr = np.radians(provider_df["Longitude"].to_numpy(dtype=float))
-    user_lat_rad = np.radians(user_lat)
-    user_lon_rad = np.radians(user_lon)
-
-    valid = ~np.isnan(lat_arr) & ~np.isnan(lon_arr)
-    dlat = lat_arr[valid] - user_lat_rad
-    dlon = lon_arr[valid] - user_lon_rad
-    a = np.sin(dlat / 2) ** 2 + np.cos(user_lat_rad) * np.cos(lat_arr[valid]) * np.sin(dlon / 2) ** 2
-    c = 2 * np.arcsin(np.sqrt(a))
-    distances = np.full(len(provider_df), np.nan)
-    distances[valid] = 3958.8 * c
+def haversine_miles(user_lat: float, user_lon: float, lats: np.ndarray, lons: np.ndarray) -> np.ndarray:
+    """Great-circle distance in miles from the user to each coordinate; NaN where a coordinate is missing."""
+    lat_rad = np.radians(np.asarray(lats, dtype=float))
+    lon_rad = np.radians(np.asarray(lons, dtype=float))
+    return haversine_miles_from_radians(user_lat, user_lon, lat_rad, lon_rad, np.cos(lat_rad))
+
+
+def haversine_miles_from_radians(
+    user_lat: float, user_lon: float, lat_rad: np.ndarray, lon_rad: np.ndarray, cos_lat: np.ndarray
+) -> np.ndarray:
+    """Haversine distance in miles using precomputed provider radians and cos(latitude).
+
+    Arithmetic runs in the dtype of the provider arrays (float32 when they come from
+    add_coordinate_trig_columns); the returned distances are float64.
+    """
+    dtype = lat_rad.dtype.type
+    user_lat_rad = dtype(np.radians(user_lat))
+    user_lon_rad = dtype(np.radians(user_lon))
+
+    # Two scratch buffers updated in place instead of a temporary per operation.
+    # Missing coordinates are NaN and propagate to NaN distances on their own.
+    a = np.subtract(lat_rad, user_lat_rad)
+    a *= 0.5
+    np.sin(a, out=a)
+    a *= a
+    b = np.subtract(lon_rad, user_lon_rad)
+    b *= 0.5
+    np.sin(b, out=b)
+    b *= b
+    b *= cos_lat
+    b *= np.cos(user_lat_rad)
+    a += b
+    # Guard against rounding pushing the haversine term past 1 for antipodal points
+    np.minimum(a, 1, out=a)
+    np.sqrt(a, out=a)
+    np.arcsin(a, out=a)
+    a *= 2 * 3958.8
+    return a.astype(np.float64, copy=False)
+
+
+def add_coordinate_trig_columns(provider_df: pd.DataFrame) -> pd.DataFrame:
+    """Store radian coordinates and cos(latitude) as _lat_rad, _lon_rad, and _cos_lat.
+
+    These terms depend only on the provider, so computing them once at load time
+    leaves just the client-dependent trig for each recommendation run. They are kept
+    as contiguous float32 arrays, which halves the memory the distance kernel streams
+    through; the error is well under 0.01 miles at regional distances.
+    """
+    lat_rad = np.radians(provider_df["Latitude"].to_numpy(dtype=np.float32, na_value=np.nan))
+    lon_rad = np.radians(provider_df["Longitude"].to_numpy(dtype=np.float32, na_value=np.nan))
+    return provider_df.assign(_lat_rad=lat_rad, _lon_rad=lon_rad, _cos_lat=np.cos(lat_rad))
+
 
+def calculate_distances(user_lat: float, user_lon: float, provider_df: pd.DataFrame) -> List[Optional[float]]:
+    distances = haversine_miles(
+        user_lat,
+        user_lon,
+        provider_df["Latitude"].to_numpy(dtype=float),
+        provider_df["Longitude"].to_numpy(dtype=float),
+    )
     return [None if np.isnan(d) else float(d) for d in distances]
 
 
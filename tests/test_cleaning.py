@@ -5,7 +5,13 @@ Tests verify address cleaning, state mapping, and data normalization functions.
 import pandas as pd
 import pytest
 
-from src.utils.cleaning import STATE_MAPPING, build_full_address, clean_address_data, safe_numeric_conversion
+from src.utils.cleaning import (
+    STATE_MAPPING,
+    build_full_address,
+    clean_address_data,
+    load_provider_data,
+    safe_numeric_conversion,
+)
 
 
 class TestCleanAddressData:
@@ -69,6 +75,29 @@ class TestCleanAddressData:
         assert result["State"].iloc[1] == "", "String 'NaN' should become empty string"
         assert result["Zip"].iloc[0] == "", "Empty string should remain empty"
 
+    def test_missing_and_blank_values_become_empty_strings(self):
+        """Real missing values and whitespace-only text are blanked like their renderings."""
+        df = pd.DataFrame({"Street": [None, "  ", " 9 Elm St "], "City": [float("nan"), "Towson", "nan "]})
+
+        result = clean_address_data(df)
+
+        assert result["Street"].tolist() == ["", "", "9 Elm St"]
+        assert result["City"].tolist() == ["", "Towson", ""]
+
+    def test_arrow_backed_missing_values_become_empty_strings(self):
+        """Arrow-backed columns holding pd.NA, or its "<NA>" rendering, are blanked."""
+        df = pd.DataFrame(
+            {
+                "Street": pd.Series(["1 Main St", pd.NA], dtype=pd.StringDtype("pyarrow")),
+                "City": pd.Series([pd.NA, "<NA>"], dtype=pd.StringDtype("pyarrow")),
+            }
+        )
+
+        result = clean_address_data(df)
+
+        assert result["Street"].tolist() == ["1 Main St", ""]
+        assert result["City"].tolist() == ["", ""]
+
     def test_empty_dataframe(self):
         """Test handling of empty DataFrame."""
         df = pd.DataFrame(columns=["Street", "City", "State", "Zip"])
@@ -79,6 +108,35 @@ class TestCleanAddressData:
         assert list(result.columns) == ["Street", "City", "State", "Zip"]
 
 
+class TestLoadProviderData:
+    """Tests for loading provider files."""
+
+    def test_missing_address_components_load_as_empty_strings(self, tmp_path):
+        """Missing address values become empty strings rather than "nan" text."""
+        path = tmp_path / "providers.csv"
+        pd.DataFrame(
+            {"Full Name": ["Dr. A", "Dr. B"], "Street": ["1 Main St", None], "Zip": [21201, None]}
+        ).to_csv(path, index=False)
+        load_provider_data.clear()
+
+        df = load_provider_data(str(path))
+
+        assert df["Street"].tolist() == ["1 Main St", ""]
+        assert df["Zip"].iloc[1] == ""
+        load_provider_data.clear()
+
+    def test_nullable_missing_rendering_loads_as_empty_string(self, tmp_path):
+        """The "<NA>" text pandas 2.x gives missing Arrow-backed values is blanked too."""
+        path = tmp_path / "providers.parquet"
+        pd.DataFrame({"Full Name": ["Dr. A", "Dr. B"], "City": ["Towson", "<NA>"]}).to_parquet(path)
+        load_provider_data.clear()
+
+        df = load_provider_data(str(path))
+
+        assert df["City"].tolist() == ["Towson", ""]
+        load_provider_data.clear()
+
+
 class TestBuildFullAddress:
     """Tests for building full addresses from components."""
 
@@ -10,7 +10,7 @@ Tests verify that:
 import pandas as pd
 import pytest
 
-from src.data.preparation import process_and_save_cleaned_referrals
+from src.data.preparation import process_and_save_cleaned_referrals, process_referral_data
 
 
 @pytest.fixture
@@ -124,3 +124,30 @@ def test_process_handles_empty_excel(tmp_path, disable_s3_only_mode):
     # Should handle empty data gracefully
     assert summary.inbound_count == 0, "Empty file should yield 0 inbound referrals"
     assert summary.outbound_count == 0, "Empty file should yield 0 outbound referrals"
+
+
+def test_process_referral_data_column_projection_matches_full_read(sample_raw_excel_data):
+    """Reading only the consumed columns yields the same datasets as reading everything."""
+    raw = sample_raw_excel_data.assign(**{"Unused Notes": "free text", "Another Export Field": 42})
+    data_bytes = raw.to_csv(index=False).encode()
+
+    full = process_referral_data(data_bytes, filename="referrals.csv")
+    projected = process_referral_data(data_bytes, filename="referrals.csv", project_columns=True)
+
+    for full_df, projected_df in zip(full[:3], projected[:3]):
+        pd.testing.assert_frame_equal(projected_df, full_df)
+
+
+def test_select_and_rename_keeps_mapping_order_and_reports_missing():
+    """Mapped columns come out in mapping order, with absent sources as NA columns."""
+    from src.data.preparation import _select_and_rename
+
+    raw = pd.DataFrame({"b": [1, 2], "a": ["x", "y"], "unused": [0, 0]}, index=[5, 7])
+
+    selected, missing = _select_and_rename(raw, {"a": "A", "c": "C", "b": "B"})
+
+    assert list(selected.columns) == ["A", "C", "B"]
+    assert list(selected.index) == [5, 7]
+    assert selected["A"].tolist() == ["x", "y"]
+    assert selected["C"].isna().all()
+    assert missing == ["c"]
@@ -2,10 +2,11 @@
 
 Tests verify accurate distance calculations between geographic coordinates.
 """
+import numpy as np
 import pandas as pd
 import pytest
 
-from src.utils.scoring import calculate_distances
+from src.utils.scoring import add_coordinate_trig_columns, calculate_distances, haversine_miles_from_radians
 
 
 class TestCalculateDistances:
@@ -142,3 +143,26 @@ class TestCalculateDistances:
         assert distances[0] > 0, "Distance should be positive"
         # Cape Town to Sydney is ~6,000+ miles
         assert distances[0] > 5000, "Cape Town to Sydney should be very far"
+
+    def test_precomputed_trig_columns_match(self):
+        """Test that distances from precomputed trig columns match the direct calculation."""
+        df = pd.DataFrame(
+            {
+                "Latitude": [40.7128, 39.9526, np.nan],
+                "Longitude": [-74.0060, -75.1652, -76.6122],
+            }
+        )
+
+        trig_df = add_coordinate_trig_columns(df)
+        precomputed = haversine_miles_from_radians(
+            39.2904,
+            -76.6122,
+            trig_df["_lat_rad"].to_numpy(),
+            trig_df["_lon_rad"].to_numpy(),
+            trig_df["_cos_lat"].to_numpy(),
+        )
+        direct = calculate_distances(39.2904, -76.6122, df)
+
+        assert trig_df["_lat_rad"].dtype == np.float32
+        assert precomputed[:2] == pytest.approx(direct[:2], abs=0.01)
+        assert np.isnan(precomputed[2]) and direct[2] is None
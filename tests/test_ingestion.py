@@ -0,0 +1,764 @@
+"""Test suite for the data ingestion manager.
+
+Tests verify that DataIngestionManager loads and post-processes the local
+parquet cache files produced by the preparation pipeline when S3 is not
+configured.
+"""
+import os
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.data.ingestion import DataIngestionManager, DataSource, _clear_processed_memo, get_ingestion_stats
+from src.data.preparation import process_and_save_cleaned_referrals
+
+
+@pytest.fixture
+def raw_referrals():
+    """Create a small raw referrals export with inbound and outbound contacts."""
+    return pd.DataFrame(
+        [
+            {
+                "Project ID": 1001,
+                "Date of Intake": pd.Timestamp("2024-01-15"),
+                "Referral Source": "Referral - Doctor's Office",
+                "Referred From Full Name": "Dr. Primary",
+                "Referred From's Work Phone": "301-555-1234",
+                "Referred From's Work Address": "1 Main St, Annapolis, MD",
+                "Referred From's Details: Latitude": "38.9784",
+                "Referred From's Details: Longitude": "-76.4922",
+                "Dr/Facility Referred To Full Name": "Clinic Destination",
+                "Dr/Facility Referred To's Work Phone": "2025559876",
+                "Dr/Facility Referred To's Work Address": "10 Care Blvd, Washington, DC",
+                "Dr/Facility Referred To's Details: Latitude": "38.9072",
+                "Dr/Facility Referred To's Details: Longitude": "-77.0369",
+            },
+            {
+                "Project ID": 1002,
+                "Date of Intake": pd.Timestamp("2024-02-01"),
+                "Referral Source": "Referral - Doctor's Office",
+                "Referred From Full Name": "Dr. Solo",
+                "Referred From's Work Phone": "410-555-0000",
+                "Referred From's Work Address": "3 Another Rd, Bowie, MD",
+                "Referred From's Details: Latitude": "39.0068",
+                "Referred From's Details: Longitude": "-76.7791",
+                "Dr/Facility Referred To Full Name": "Clinic Destination",
+                "Dr/Facility Referred To's Work Phone": "2025559876",
+                "Dr/Facility Referred To's Work Address": "10 Care Blvd, Washington, DC",
+                "Dr/Facility Referred To's Details: Latitude": "38.9072",
+                "Dr/Facility Referred To's Details: Longitude": "-77.0369",
+            },
+            {
+                "Project ID": 1003,
+                "Date of Intake": pd.Timestamp("2024-03-01"),
+                "Referral Source": "Google",
+                "Dr/Facility Referred To Full Name": "Therapy Partners",
+                "Dr/Facility Referred To's Work Phone": "301-555-9999",
+                "Dr/Facility Referred To's Work Address": "20 Wellness Ave, Greenbelt, MD",
+                "Dr/Facility Referred To's Details: Latitude": "39.0046",
+                "Dr/Facility Referred To's Details: Longitude": "-76.8755",
+            },
+        ]
+    )
+
+
+@pytest.fixture
+def local_cache(tmp_path, monkeypatch, raw_referrals, disable_s3_only_mode):
+    """Write cleaned parquet files to data/processed under a temporary working directory."""
+    raw_path = tmp_path / "Referrals_App_Full_Contacts.csv"
+    raw_referrals.to_csv(raw_path, index=False)
+    process_and_save_cleaned_referrals(raw_path, tmp_path / "data" / "processed")
+    monkeypatch.chdir(tmp_path)
+    return tmp_path / "data" / "processed"
+
+
+def test_local_parquet_provider_data_is_aggregated(local_cache):
+    """PROVIDER_DATA aggregates outbound referrals into one row per provider."""
+    manager = DataIngestionManager()
+
+    df = manager.load_data(DataSource.PROVIDER_DATA, show_status=False)
+
+    assert df["Full Name"].is_unique
+    counts = df.set_index("Full Name")["Referral Count"]
+    assert counts["Clinic Destination"] == 2
+    assert counts["Therapy Partners"] == 1
+    assert {"Work Address", "Work Phone", "Latitude", "Longitude"}.issubset(df.columns)
+
+
+def test_s3_provider_data_is_aggregated_once(monkeypatch):
+    """load_data returns the already-aggregated provider frame without re-aggregating it."""
+    from src.data import ingestion
+
+    manager = DataIngestionManager()
+    providers = pd.DataFrame({"Full Name": ["Dr. A"], "Referral Count": [3]})
+    aggregations = []
+    monkeypatch.setattr(ingestion.config, "is_api_enabled", lambda name: True)
+    monkeypatch.setattr(manager, "_load_and_process_data", lambda source: providers)
+    monkeypatch.setattr(manager, "_process_provider_data", lambda df: aggregations.append(df) or df)
+
+    df = manager.load_data(DataSource.PROVIDER_DATA, show_status=False)
+
+    assert df is providers
+    assert aggregations == []
+
+
+def test_local_parquet_referrals_load_all_columns(local_cache):
+    """Referral sources are returned as stored in the cleaned parquet files."""
+    manager = DataIngestionManager()
+
+    inbound = manager.load_data(DataSource.INBOUND_REFERRALS, show_status=False)
+    outbound = manager.load_data(DataSource.OUTBOUND_REFERRALS, show_status=False)
+
+    assert set(inbound["Full Name"]) == {"Dr. Primary", "Dr. Solo"}
+    assert len(outbound) == 3
+    assert "referral_type" in outbound.columns
+
+
+def test_local_parquet_missing_file_returns_empty(tmp_path, monkeypatch, disable_s3_only_mode):
+    """A missing cache file yields an empty DataFrame rather than an error."""
+    monkeypatch.chdir(tmp_path)
+    manager = DataIngestionManager()
+
+    df = manager.load_data(DataSource.PROVIDER_DATA, show_status=False)
+
+    assert df.empty
+
+
+def test_local_parquet_text_columns_are_arrow_backed(local_cache):
+    """Text columns come back as Arrow-backed strings with missing values cleaned to ''."""
+    manager = DataIngestionManager()
+
+    df = manager.load_data(DataSource.PROVIDER_DATA, show_status=False)
+
+    for col in ["Full Name", "Work Address"]:
+        assert isinstance(df[col].dtype, pd.StringDtype)
+        assert df[col].dtype.storage == "pyarrow"
+    assert not df["Work Phone"].isna().any()
+    assert pd.api.types.is_float_dtype(df["Latitude"])
+    assert df["Referral Count"].dtype == np.int32
+
+
+def test_provider_text_columns_fill_missing_with_empty_strings():
+    """Missing provider text values become empty Arrow-backed strings."""
+    manager = DataIngestionManager()
+    referrals = pd.DataFrame(
+        {
+            "Full Name": ["Dr. A", "Dr. B"],
+            "Project ID": [1, 2],
+            "Work Address": ["1 Main St", None],
+            "Work Phone": [np.nan, "(410) 555-0101"],
+        }
+    )
+
+    providers = manager._process_provider_data(referrals).set_index("Full Name")
+
+    assert providers.loc["Dr. B", "Work Address"] == ""
+    assert providers.loc["Dr. A", "Work Phone"] == ""
+    assert isinstance(providers["Work Address"].dtype, pd.StringDtype)
+
+
+def test_is_cleaned_data_needs_four_standardized_columns():
+    """Frames count as cleaned once four standardized columns are present, however wide they are."""
+    manager = DataIngestionManager()
+    raw = pd.DataFrame(columns=[f"Raw {i}" for i in range(500)] + ["Full Name", "Latitude", "Longitude"])
+
+    assert manager._is_cleaned_data(raw) is False
+    assert manager._is_cleaned_data(raw.assign(**{"Work Address": ""})) is True
+
+
+def test_process_all_referrals_splits_directions_in_row_order():
+    """Raw rows become one outbound and/or inbound row each, in source order."""
+    raw = pd.DataFrame(
+        {
+            "Project ID": [1, 2, 3],
+            "Date of Intake": pd.to_datetime(["2024-01-01", "2024-01-02", "2024-01-03"]),
+            "Referred To Full Name": ["Clinic A", None, "Clinic C"],
+            "Referred To's Work Phone": ["3015550001", None, "3015550003"],
+            "Referred From Full Name": ["Dr. X", "Dr. Y", None],
+            "Referred From's Work Address": ["1 Main St", "2 Oak Ave", None],
+        }
+    )
+
+    result = DataIngestionManager()._process_all_referrals(raw)
+
+    assert list(result["Full Name"]) == ["Clinic A", "Dr. X", "Dr. Y", "Clinic C"]
+    assert list(result["referral_type"]) == ["outbound", "inbound", "inbound", "outbound"]
+    assert list(result["Project ID"]) == [1, 1, 2, 3]
+    assert result["Work Phone"].iloc[0] == "3015550001"
+    assert result["Work Address"].iloc[1] == "1 Main St"
+    assert result["Latitude"].isna().all()
+    # Each direction's raw columns are renamed rather than duplicated
+    outbound = result[result["referral_type"] == "outbound"]
+    assert outbound["Referred To Full Name"].isna().all()
+
+
+def test_process_referrals_maps_direction_columns():
+    """Single-direction processing renames that direction's raw columns and tags the rows."""
+    raw = pd.DataFrame(
+        {
+            "Referred From Full Name": ["Dr. X"],
+            "Referred From's Work Phone": ["3015550001"],
+            "Date of Intake": ["2024-01-02"],
+        }
+    )
+
+    result = DataIngestionManager()._process_referrals(raw, DataSource.INBOUND_REFERRALS)
+
+    assert list(result["Full Name"]) == ["Dr. X"]
+    assert list(result["referral_type"]) == ["inbound"]
+    assert "Referred From Full Name" not in result.columns
+    assert result["Referral Date"].iloc[0] == pd.Timestamp("2024-01-02")
+    assert "Full Name" not in raw.columns
+
+
+class _ListingOnlyS3Client:
+    """S3 client double that records listings and refuses downloads."""
+
+    def __init__(self):
+        self.list_calls = []
+
+    def list_files_batch(self, folder_types):
+        self.list_calls.append(list(folder_types))
+        return {"referrals": [("referrals_2024.csv", pd.Timestamp("2024-05-01"))], "preferred_providers": []}
+
+    def download_file(self, folder_type, filename):
+        raise AssertionError("get_data_status should not download file contents")
+
+
+def test_get_data_status_lists_folders_once():
+    """Status for every source comes from one batched listing, cached across calls."""
+    manager = DataIngestionManager()
+    manager._s3_client = _ListingOnlyS3Client()
+    manager._list_latest_s3_files.clear()
+    manager._get_data_status_cached.clear()
+
+    status = manager.get_data_status()
+    manager.get_data_status()
+
+    assert manager._s3_client.list_calls == [["referrals", "preferred_providers"]]
+    assert status[DataSource.OUTBOUND_REFERRALS.value]["available"] is True
+    assert status[DataSource.OUTBOUND_REFERRALS.value]["filename"] == "referrals_2024.csv"
+    assert status[DataSource.OUTBOUND_REFERRALS.value]["last_modified"] == "2024-05-01T00:00:00"
+    assert status[DataSource.PREFERRED_PROVIDERS.value]["available"] is False
+    manager._list_latest_s3_files.clear()
+    manager._get_data_status_cached.clear()
+
+
+class _StaticS3Client:
+    """S3 client double serving one referrals file with a fixed modification time."""
+
+    def __init__(self, data_bytes, last_modified):
+        self.data_bytes = data_bytes
+        self.last_modified = last_modified
+        self.list_calls = 0
+        self.downloads = []
+
+    def list_files_batch(self, folder_types):
+        self.list_calls += 1
+        return {folder_type: [(f"{folder_type}.csv", self.last_modified)] for folder_type in folder_types}
+
+    def download_file(self, folder_type, filename):
+        self.downloads.append(filename)
+        return self.data_bytes
+
+
+def test_processed_s3_data_is_keyed_on_last_modified(raw_referrals, tmp_path, monkeypatch):
+    """Processing is reused for the same S3 object version and redone when it changes."""
+    monkeypatch.chdir(tmp_path)
+    manager = DataIngestionManager()
+    manager._s3_client = _StaticS3Client(raw_referrals.to_csv(index=False).encode(), pd.Timestamp("2024-05-01"))
+    processed = []
+    monkeypatch.setattr(
+        manager, "_process_referral_data", lambda source, data_bytes, filename: processed.append(source) or raw_referrals
+    )
+    manager._list_latest_s3_files.clear()
+    manager._load_and_process_data_cached.clear()
+    _clear_processed_memo()
+
+    manager._load_and_process_data(DataSource.OUTBOUND_REFERRALS)
+    manager._load_and_process_data(DataSource.OUTBOUND_REFERRALS)
+    assert processed == [DataSource.OUTBOUND_REFERRALS]
+
+    # A new upload shows up once the short-lived download cache expires
+    manager._s3_client.last_modified = pd.Timestamp("2024-06-01")
+    manager._list_latest_s3_files.clear()
+    manager._load_and_process_data(DataSource.OUTBOUND_REFERRALS)
+    assert processed == [DataSource.OUTBOUND_REFERRALS] * 2
+    manager._list_latest_s3_files.clear()
+    manager._load_and_process_data_cached.clear()
+    _clear_processed_memo()
+
+
+def test_processed_s3_data_is_snapshotted_for_local_fallback(raw_referrals, tmp_path, monkeypatch):
+    """Processed S3 data is written as one Parquet snapshot per source and served when S3 is empty."""
+    monkeypatch.chdir(tmp_path)
+    manager = DataIngestionManager()
+    manager._s3_client = _StaticS3Client(raw_referrals.to_csv(index=False).encode(), pd.Timestamp("2024-05-01"))
+    manager._list_latest_s3_files.clear()
+    manager._load_and_process_data_cached.clear()
+    _clear_processed_memo()
+
+    processed = manager._load_and_process_data(DataSource.OUTBOUND_REFERRALS)
+    manager._s3_client.last_modified = pd.Timestamp("2024-06-01")
+    manager._list_latest_s3_files.clear()
+    manager._load_and_process_data(DataSource.OUTBOUND_REFERRALS)
+
+    snapshots = sorted(p.name for p in (tmp_path / "data" / "processed").glob("s3_outbound_*.parquet"))
+    assert snapshots == ["s3_outbound_20240601T000000_v1.parquet"]
+
+    fallback = manager._load_from_local_parquet(DataSource.OUTBOUND_REFERRALS)
+    assert list(fallback["Full Name"]) == list(processed["Full Name"])
+    manager._list_latest_s3_files.clear()
+    manager._load_and_process_data_cached.clear()
+    _clear_processed_memo()
+
+
+def test_snapshot_of_current_version_replaces_download_after_refresh(raw_referrals, tmp_path, monkeypatch):
+    """After the Streamlit cache is cleared, the same S3 version is read from its Parquet snapshot."""
+    monkeypatch.chdir(tmp_path)
+    manager = DataIngestionManager()
+    manager._s3_client = _StaticS3Client(raw_referrals.to_csv(index=False).encode(), pd.Timestamp("2024-05-01"))
+    manager._list_latest_s3_files.clear()
+    manager._load_and_process_data_cached.clear()
+    _clear_processed_memo()
+
+    processed = manager._load_and_process_data(DataSource.OUTBOUND_REFERRALS)
+    manager._s3_client.downloads.clear()
+    manager._list_latest_s3_files.clear()
+    manager._load_and_process_data_cached.clear()
+    _clear_processed_memo()
+
+    reloaded = manager._load_and_process_data(DataSource.OUTBOUND_REFERRALS)
+
+    assert manager._s3_client.downloads == []
+    assert list(reloaded["Full Name"]) == list(processed["Full Name"])
+    manager._list_latest_s3_files.clear()
+    manager._load_and_process_data_cached.clear()
+    _clear_processed_memo()
+
+
+def test_latest_snapshot_scan_follows_directory_changes(tmp_path, monkeypatch):
+    """A cached snapshot scan is redone once a snapshot is added to the directory."""
+    from src.data import ingestion
+
+    monkeypatch.chdir(tmp_path)
+    processed = tmp_path / "data" / "processed"
+    processed.mkdir(parents=True)
+    assert ingestion._latest_s3_snapshot(DataSource.INBOUND_REFERRALS) is None
+
+    snapshot = ingestion._s3_snapshot_path(DataSource.INBOUND_REFERRALS, "2024-05-01T00:00:00Z")
+    pd.DataFrame({"Full Name": ["Dr. A"]}).to_parquet(snapshot)
+    os.utime(processed, ns=(0, processed.stat().st_mtime_ns + 1))
+
+    assert ingestion._latest_s3_snapshot(DataSource.INBOUND_REFERRALS) == snapshot
+
+
+def test_local_parquet_prefers_newer_of_snapshot_and_cleaned_file(tmp_path, monkeypatch):
+    """A leftover S3 snapshot does not hide a cleaned file written after it."""
+    from src.data import ingestion
+
+    monkeypatch.chdir(tmp_path)
+    processed = tmp_path / "data" / "processed"
+    processed.mkdir(parents=True)
+    snapshot = ingestion._s3_snapshot_path(DataSource.INBOUND_REFERRALS, "2024-05-01T00:00:00Z")
+    pd.DataFrame({"Full Name": ["Dr. A"]}).to_parquet(snapshot)
+    cleaned = ingestion._PROCESSED_DIR / "cleaned_inbound_referrals.parquet"
+    assert ingestion._local_parquet_path(DataSource.INBOUND_REFERRALS) == snapshot
+
+    pd.DataFrame({"Full Name": ["Dr. B"]}).to_parquet(cleaned)
+    os.utime(snapshot, ns=(0, 1_000_000_000))
+    os.utime(cleaned, ns=(0, 2_000_000_000))
+    assert ingestion._local_parquet_path(DataSource.INBOUND_REFERRALS) == cleaned
+
+    os.utime(snapshot, ns=(0, 3_000_000_000))
+    assert ingestion._local_parquet_path(DataSource.INBOUND_REFERRALS) == snapshot
+
+
+def test_cached_s3_data_is_not_downloaded_again(raw_referrals, tmp_path, monkeypatch):
+    """Once a version is processed, later loads of it only list S3 and skip the download."""
+    monkeypatch.chdir(tmp_path)
+    manager = DataIngestionManager()
+    manager._s3_client = _StaticS3Client(raw_referrals.to_csv(index=False).encode(), pd.Timestamp("2024-05-01"))
+    manager._list_latest_s3_files.clear()
+    manager._load_and_process_data_cached.clear()
+    _clear_processed_memo()
+
+    manager._load_and_process_data(DataSource.OUTBOUND_REFERRALS)
+    assert manager._s3_client.downloads
+
+    # Simulate a restart: short-lived caches and the in-process memo are gone
+    manager._s3_client.downloads.clear()
+    manager._list_latest_s3_files.clear()
+    _clear_processed_memo()
+    df = manager._load_and_process_data(DataSource.OUTBOUND_REFERRALS)
+
+    assert not df.empty
+    assert manager._s3_client.downloads == []
+    manager._list_latest_s3_files.clear()
+    manager._load_and_process_data_cached.clear()
+    _clear_processed_memo()
+
+
+def test_processed_s3_data_hot_hits_skip_streamlit_cache(raw_referrals, tmp_path, monkeypatch):
+    """Repeat loads of the same S3 object version are served from the in-process memo."""
+    monkeypatch.chdir(tmp_path)
+    manager = DataIngestionManager()
+    manager._s3_client = _StaticS3Client(raw_referrals.to_csv(index=False).encode(), pd.Timestamp("2024-05-01"))
+    manager._list_latest_s3_files.clear()
+    _clear_processed_memo()
+    calls = []
+    monkeypatch.setattr(
+        manager, "_load_and_process_data_cached", lambda *args: calls.append(args[0]) or raw_referrals.copy()
+    )
+
+    before = get_ingestion_stats().get("outbound", {"hits": 0, "misses": 0})
+
+    first = manager._load_and_process_data(DataSource.OUTBOUND_REFERRALS)
+    second = manager._load_and_process_data(DataSource.OUTBOUND_REFERRALS)
+
+    assert calls == [DataSource.OUTBOUND_REFERRALS]
+    assert first is not second
+    pd.testing.assert_frame_equal(first, second)
+    after = get_ingestion_stats()["outbound"]
+    assert (after["hits"] - before["hits"], after["misses"] - before["misses"]) == (1, 1)
+    assert after["last_load_ms"] >= 0
+    manager._list_latest_s3_files.clear()
+    _clear_processed_memo()
+
+
+def test_s3_data_downloads_only_the_requested_folder(raw_referrals):
+    """Sources share one listing, and each request downloads only its own folder's latest file."""
+    manager = DataIngestionManager()
+    manager._s3_client = _StaticS3Client(raw_referrals.to_csv(index=False).encode(), pd.Timestamp("2024-05-01"))
+    manager._list_latest_s3_files.clear()
+
+    referrals = manager._get_s3_data("referrals")
+
+    assert manager._s3_client.downloads == ["referrals.csv"]
+    assert referrals[1] == "referrals.csv"
+    assert referrals[2] == "2024-05-01T00:00:00"
+
+    preferred = manager._get_s3_data("preferred_providers")
+
+    assert manager._s3_client.list_calls == 1
+    assert manager._s3_client.downloads == ["referrals.csv", "preferred_providers.csv"]
+    assert preferred[1] == "preferred_providers.csv"
+    manager._list_latest_s3_files.clear()
+
+
+def test_referral_sources_share_one_parse_of_the_file(raw_referrals, monkeypatch):
+    """Referral sources processed from the same file bytes parse it only once."""
+    from src.data import ingestion
+
+    _clear_processed_memo()
+    parses = []
+    real_process = ingestion.process_referral_data
+    monkeypatch.setattr(
+        ingestion, "process_referral_data", lambda *args, **kwargs: parses.append(1) or real_process(*args, **kwargs)
+    )
+    manager = DataIngestionManager()
+    data_bytes = raw_referrals.to_csv(index=False).encode()
+
+    outbound = manager._process_referral_data(DataSource.OUTBOUND_REFERRALS, data_bytes, "referrals.csv")
+    providers = manager._process_referral_data(DataSource.PROVIDER_DATA, bytes(data_bytes), "referrals.csv")
+    inbound = manager._process_referral_data(DataSource.INBOUND_REFERRALS, data_bytes, "referrals.csv")
+
+    assert len(parses) == 1
+    assert not outbound.empty and not inbound.empty
+    assert providers["Full Name"].is_unique
+    _clear_processed_memo()
+
+
+def test_preferred_providers_columns_are_renamed_not_copied():
+    """Raw contact columns are renamed onto the standardized schema without leaving duplicates."""
+    raw = pd.DataFrame(
+        {
+            "Contact Full Name": ["Dr. Pref", "Dr. Pref"],
+            "Contact's Work Phone": ["3015550100", "3015550100"],
+            "Contact's Details: Latitude": [39.0, 39.0],
+            "Contact's Details: Longitude": [-76.9, -76.9],
+            "Contact's Details: Person ID": [7, 7],
+            "Full Name": ["stale", "stale"],
+        }
+    )
+
+    df = DataIngestionManager()._process_preferred_providers_data(raw.to_csv(index=False).encode(), "preferred.csv")
+
+    assert list(df["Full Name"]) == ["Dr. Pref"]
+    assert df.columns.is_unique
+    assert not any(col.startswith("Contact") for col in df.columns)
+    assert {"Work Phone", "Latitude", "Longitude", "Person ID"}.issubset(df.columns)
+
+
+@pytest.mark.parametrize("typed", [False, True])
+def test_standardize_dates_masks_old_dates_and_takes_first_available(typed):
+    """Out-of-range dates become NaT and Referral Date falls back per row to the next date column."""
+    df = pd.DataFrame(
+        {
+            "Create Date": ["1985-06-01", "2024-01-10", None],
+            "Date of Intake": ["2024-02-01", "2024-02-02", "2024-02-03"],
+            "Last Verified Date": ["1970-01-01", "2024-03-01", "2205-01-01"],
+        }
+    )
+    if typed:
+        df = df.apply(pd.to_datetime)
+
+    result = DataIngestionManager()._standardize_dates(df)
+
+    assert result["Create Date"].isna().tolist() == [True, False, True]
+    assert result["Last Verified Date"].isna().tolist() == [True, False, True]
+    assert list(result["Referral Date"]) == [
+        pd.Timestamp("2024-02-01"),
+        pd.Timestamp("2024-01-10"),
+        pd.Timestamp("2024-02-03"),
+    ]
+
+
+def test_compat_loaders_reload_when_the_data_version_changes(monkeypatch):
+    """Compatibility loaders are cached per data version, not only by function identity."""
+    from src.data import ingestion
+
+    manager = DataIngestionManager()
+    version = {"last_modified": "2024-05-01T00:00:00"}
+    loads = []
+    monkeypatch.setattr(ingestion, "get_data_manager", lambda: manager)
+    monkeypatch.setattr(ingestion.config, "is_api_enabled", lambda name: True)
+    monkeypatch.setattr(
+        manager, "_list_latest_s3_files", lambda: {"referrals": ("referrals.csv", version["last_modified"])}
+    )
+    monkeypatch.setattr(
+        manager,
+        "load_data",
+        lambda source, show_status=True: loads.append(source) or pd.DataFrame({"n": [len(loads)]}),
+    )
+    ingestion._load_source_cached.clear()
+
+    first = ingestion.load_inbound_referrals()
+    again = ingestion.load_inbound_referrals()
+    version["last_modified"] = "2024-06-01T00:00:00"
+    updated = ingestion.load_inbound_referrals()
+
+    assert loads == [DataSource.INBOUND_REFERRALS, DataSource.INBOUND_REFERRALS]
+    assert first["n"].tolist() == again["n"].tolist() == [1]
+    assert updated["n"].tolist() == [2]
+    ingestion._load_source_cached.clear()
+
+
+def test_validate_all_data_sources_reports_every_source_in_order(monkeypatch):
+    """Concurrent validation returns one entry per source, with failures captured per source."""
+    import src.data.ingestion as ingestion
+
+    manager = DataIngestionManager()
+
+    def fake_validate(source):
+        if source == DataSource.PREFERRED_PROVIDERS:
+            raise RuntimeError("boom")
+        return {"valid": True, "row_count": 1}
+
+    monkeypatch.setattr(manager, "validate_data_integrity", fake_validate)
+    monkeypatch.setattr(ingestion, "get_data_manager", lambda: manager)
+
+    results = ingestion.validate_all_data_sources()
+
+    assert list(results) == [source.value for source in DataSource]
+    assert results[DataSource.PREFERRED_PROVIDERS.value]["error"] == "boom"
+    assert results[DataSource.OUTBOUND_REFERRALS.value]["valid"] is True
+
+
+def test_validate_data_integrity_is_cached_per_source(monkeypatch):
+    """Repeat validations of a source reuse the cached report instead of reloading the data."""
+    manager = DataIngestionManager()
+    loads = []
+    frame = pd.DataFrame({"Full Name": ["A", "A", "B"], "Project ID": [1, 2, None]})
+    monkeypatch.setattr(manager, "load_data", lambda source, show_status=True: loads.append(source) or frame)
+    manager._validate_data_integrity_cached.clear()
+
+    first = manager.validate_data_integrity(DataSource.OUTBOUND_REFERRALS)
+    second = manager.validate_data_integrity(DataSource.OUTBOUND_REFERRALS)
+
+    assert loads == [DataSource.OUTBOUND_REFERRALS]
+    assert first == second
+    assert first["valid"] is True
+    assert first["duplicate_names"] == 1
+    assert first["missing_values_pct"] == round(1 / 6 * 100, 2)
+    manager._validate_data_integrity_cached.clear()
+
+
+def test_validate_data_integrity_recomputes_for_new_data_version(monkeypatch):
+    """A new data version (e.g. a fresh upload) gets its own report instead of the cached one."""
+    manager = DataIngestionManager()
+    loads = []
+    frame = pd.DataFrame({"Full Name": ["A", "B"], "Project ID": [1, 2]})
+    monkeypatch.setattr(manager, "load_data", lambda source, show_status=True: loads.append(source) or frame)
+    versions = iter([("s3", "a.csv", "2024-05-01"), ("s3", "a.csv", "2024-05-01"), ("s3", "b.csv", "2024-06-01")])
+    monkeypatch.setattr(manager, "_source_version", lambda source: next(versions))
+    manager._validate_data_integrity_cached.clear()
+
+    for _ in range(3):
+        manager.validate_data_integrity(DataSource.OUTBOUND_REFERRALS)
+
+    assert loads == [DataSource.OUTBOUND_REFERRALS] * 2
+    manager._validate_data_integrity_cached.clear()
+
+
+def test_validate_data_integrity_counts_out_of_range_coordinates(monkeypatch):
+    """Coordinates outside valid bounds are counted; missing coordinates are not."""
+    manager = DataIngestionManager()
+    frame = pd.DataFrame(
+        {
+            "Full Name": ["A", "B", "C", "D"],
+            "Project ID": [1, 2, 3, 4],
+            "Latitude": [39.0, 95.0, None, -39.0],
+            "Longitude": [-76.0, -76.0, -200.0, 181.0],
+        }
+    )
+    monkeypatch.setattr(manager, "load_data", lambda source, show_status=True: frame)
+    manager._validate_data_integrity_cached.clear()
+
+    report = manager.validate_data_integrity(DataSource.OUTBOUND_REFERRALS)
+
+    assert report["invalid_coordinates"] == 3
+    assert report["missing_values_pct"] == 6.25
+    manager._validate_data_integrity_cached.clear()
+
+
+def test_validate_data_integrity_skips_scans_when_required_columns_missing(monkeypatch):
+    """A frame missing required columns is reported invalid with zeroed data stats."""
+    manager = DataIngestionManager()
+    frame = pd.DataFrame({"Full Name": ["A", "A"], "Latitude": [95.0, None]})
+    monkeypatch.setattr(manager, "load_data", lambda source, show_status=True: frame)
+    manager._validate_data_integrity_cached.clear()
+
+    report = manager.validate_data_integrity(DataSource.OUTBOUND_REFERRALS)
+
+    assert report["valid"] is False
+    assert report["missing_required_columns"] == ["Project ID"]
+    assert report["row_count"] == 2
+    assert report["duplicate_names"] == report["invalid_coordinates"] == report["missing_values_pct"] == 0
+    manager._validate_data_integrity_cached.clear()
+
+
+def test_validate_data_integrity_checks_bounds_of_present_columns(monkeypatch):
+    """Each bounded column is checked on its own, so a lone Latitude column is still validated."""
+    manager = DataIngestionManager()
+    frame = pd.DataFrame({"Full Name": ["A", "B"], "Project ID": [1, 2], "Latitude": [39.0, -91.0]})
+    monkeypatch.setattr(manager, "load_data", lambda source, show_status=True: frame)
+    manager._validate_data_integrity_cached.clear()
+
+    report = manager.validate_data_integrity(DataSource.OUTBOUND_REFERRALS)
+
+    assert report["invalid_coordinates"] == 1
+    manager._validate_data_integrity_cached.clear()
+
+
+@pytest.mark.parametrize("dtype", ["object", "category", "string[pyarrow]"])
+def test_validate_data_integrity_duplicate_names_by_dtype(monkeypatch, dtype):
+    """Duplicate names are counted the same for text and categorical name columns."""
+    manager = DataIngestionManager()
+    frame = pd.DataFrame({"Full Name": pd.Series(["A", "A", "B", None, None], dtype=dtype), "Referral Count": 1})
+    monkeypatch.setattr(manager, "load_data", lambda source, show_status=True: frame)
+    manager._validate_data_integrity_cached.clear()
+
+    report = manager.validate_data_integrity(DataSource.PROVIDER_DATA)
+
+    assert report["valid"] is True
+    assert report["duplicate_names"] == 2
+    manager._validate_data_integrity_cached.clear()
+
+
+def test_daily_cache_refresh_runs_once_per_period(monkeypatch):
+    """The cache is refreshed at the first check of each 4 AM period, shared across checks."""
+    import datetime as dt
+
+    import src.data.ingestion as ingestion
+
+    clock = {"now": dt.datetime(2024, 5, 1, 3, 0)}
+
+    class _FixedDatetime(dt.datetime):
+        @classmethod
+        def now(cls, tz=None):
+            return clock["now"]
+
+    refreshes = []
+    monkeypatch.setattr(ingestion, "datetime", _FixedDatetime)
+    monkeypatch.setattr(ingestion, "_last_daily_refresh_period", None)
+    monkeypatch.setattr(ingestion, "refresh_data_cache", lambda: refreshes.append(clock["now"]))
+    manager = DataIngestionManager()
+    monkeypatch.setattr(manager, "preload_data", lambda: None)
+
+    assert manager.check_and_refresh_daily_cache() is False  # a fresh process only seeds the period
+    clock["now"] = dt.datetime(2024, 5, 1, 4, 30)
+    assert manager.check_and_refresh_daily_cache() is True
+    clock["now"] = dt.datetime(2024, 5, 2, 1, 0)
+    assert manager.check_and_refresh_daily_cache() is False  # still the 1 May period
+    clock["now"] = dt.datetime(2024, 5, 2, 4, 0)
+    assert manager.check_and_refresh_daily_cache() is True
+    assert manager.check_and_refresh_daily_cache() is False
+
+    assert refreshes == [dt.datetime(2024, 5, 1, 4, 30), dt.datetime(2024, 5, 2, 4, 0)]
+
+
+def test_daily_cache_refresh_skips_first_check_after_4am(monkeypatch):
+    """A process started after 4 AM does not clear caches on its first check."""
+    import datetime as dt
+
+    import src.data.ingestion as ingestion
+
+    class _FixedDatetime(dt.datetime):
+        @classmethod
+        def now(cls, tz=None):
+            return dt.datetime(2024, 5, 1, 10, 0)
+
+    refreshes = []
+    monkeypatch.setattr(ingestion, "datetime", _FixedDatetime)
+    monkeypatch.setattr(ingestion, "_last_daily_refresh_period", None)
+    monkeypatch.setattr(ingestion, "refresh_data_cache", lambda: refreshes.append(1))
+    manager = DataIngestionManager()
+
+    assert manager.check_and_refresh_daily_cache() is False
+    assert manager.check_and_refresh_daily_cache() is False
+    assert refreshes == []
+
+
+def test_data_manager_proxy_caches_bound_methods(monkeypatch):
+    """The proxy resolves the singleton once per method name and reads plain attributes live."""
+    import src.data.ingestion as ingestion
+
+    manager = DataIngestionManager()
+    lookups = []
+    monkeypatch.setattr(ingestion, "get_data_manager", lambda: lookups.append(1) or manager)
+    proxy = ingestion._DataManagerProxy()
+
+    assert proxy.load_data == manager.load_data
+    assert proxy.load_data == manager.load_data
+    assert len(lookups) == 1
+
+    manager.cache_ttl = 10
+    assert proxy.cache_ttl == 10
+    manager.cache_ttl = 20
+    assert proxy.cache_ttl == 20
+
+
+def test_preload_runs_once_until_cache_refresh(monkeypatch):
+    """Repeated preloads skip the loads until refresh_data_cache clears the caches."""
+    import src.data.ingestion as ingestion
+
+    manager = DataIngestionManager()
+    loads = []
+
+    def fake_load(source, show_status=True):
+        loads.append(source)
+        return pd.DataFrame({"Full Name": ["A"]})
+
+    monkeypatch.setattr(manager, "load_data", fake_load)
+    ingestion.refresh_data_cache()
+
+    manager.preload_data()
+    manager.preload_data()
+    assert len(loads) == 3
+
+    ingestion.refresh_data_cache()
+    manager.preload_data()
+    assert len(loads) == 6
+    ingestion.refresh_data_cache()
@@ -11,7 +11,7 @@ import pytest
 from io import BytesIO
 from pathlib import Path
 
-from src.data.io_utils import looks_like_excel_bytes, detect_file_format, load_dataframe
+from src.data.io_utils import looks_like_excel_bytes, detect_file_format, load_dataframe, read_csv
 
 
 def test_looks_like_excel_bytes_xlsx():
@@ -137,6 +137,69 @@ def test_load_dataframe_from_bytes():
     assert 'Age' in result_df.columns
 
 
+def test_load_dataframe_csv_bytes_missing_values():
+    """Test that empty CSV fields load as missing values."""
+    csv_data = b'Name,Phone,Latitude\nAlice,,38.9\nBob,301-555-1234,\n'
+
+    result_df = load_dataframe(csv_data, filename="test.csv")
+
+    assert result_df['Phone'].isna().tolist() == [True, False]
+    assert result_df['Latitude'].isna().tolist() == [False, True]
+    assert result_df.loc[0, 'Latitude'] == pytest.approx(38.9)
+
+
+def test_load_dataframe_csv_duplicate_headers_fall_back():
+    """Test that CSVs pyarrow cannot represent still load via pandas."""
+    csv_data = b'Name,Name\nAlice,Smith\n'
+
+    result_df = load_dataframe(csv_data, filename="test.csv")
+
+    assert list(result_df.columns) == ['Name', 'Name.1']
+
+
+@pytest.mark.parametrize('csv_data', [b'Name,Age,Notes\nAlice,30,x\n', b'Name,Name,Age\nAlice,Smith,30\n'])
+def test_read_csv_usecols_filters_columns(csv_data):
+    """Test that the column filter applies on both the pyarrow and pandas paths."""
+    result_df = read_csv(BytesIO(csv_data), usecols=lambda name: name in {'Name', 'Age'})
+
+    assert list(result_df.columns) == ['Name', 'Age']
+    assert result_df['Age'].tolist() == [30]
+
+
+def test_read_csv_usecols_handles_bom_and_quoted_headers():
+    """Test that header projection matches names the way the CSV parser reads them."""
+    csv_data = '\ufeffName,"City, State",Notes\r\nAlice,"Baltimore, MD",x\r\n'.encode()
+
+    result_df = read_csv(BytesIO(csv_data), usecols=lambda name: name in {'Name', 'City, State'})
+
+    assert list(result_df.columns) == ['Name', 'City, State']
+    assert result_df['City, State'].tolist() == ['Baltimore, MD']
+
+
+def test_read_csv_text_columns_are_arrow_backed():
+    """Test that parsed text stays in Arrow-backed string columns."""
+    result_df = read_csv(BytesIO(b'Name,Age\nAlice,30\n,25\n'))
+
+    assert isinstance(result_df['Name'].dtype, pd.StringDtype)
+    assert result_df['Name'].dtype.storage == 'pyarrow'
+    assert result_df['Name'].isna().tolist() == [False, True]
+    assert pd.api.types.is_integer_dtype(result_df['Age'])
+
+
+def test_load_dataframe_excel_falls_back_when_calamine_fails(monkeypatch):
+    """Test that Excel bytes still load via openpyxl if the calamine engine cannot be used."""
+    import src.data.io_utils as io_utils
+
+    buffer = BytesIO()
+    pd.DataFrame({'Name': ['Alice', 'Bob'], 'Age': [30, 25]}).to_excel(buffer, index=False, sheet_name='Providers')
+    monkeypatch.setattr(io_utils, 'CALAMINE_AVAILABLE', True)
+
+    result_df = load_dataframe(buffer.getvalue(), filename="test.xlsx", sheet_name='Providers')
+
+    assert result_df['Name'].tolist() == ['Alice', 'Bob']
+    assert result_df['Age'].tolist() == [30, 25]
+
+
 def test_load_dataframe_file_not_found():
     """Test error handling for missing file."""
     with pytest.raises(FileNotFoundError):
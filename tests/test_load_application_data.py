@@ -0,0 +1,194 @@
+"""Test suite for the application data loader.
+
+Tests verify that load_application_data combines provider, inbound referral,
+and preferred provider data into a single provider table that the
+recommendation workflow can consume.
+"""
+import numpy as np
+import pandas as pd
+import pytest
+
+import src.app_logic as app_logic
+import src.data.ingestion as ingestion
+
+
+@pytest.fixture
+def stub_loaders(monkeypatch, tmp_path, disable_s3_only_mode):
+    """Replace the ingestion-backed loaders with small in-memory frames."""
+    # Run from an empty directory so no local parquet files enable the disk cache
+    monkeypatch.chdir(tmp_path)
+    provider_df = pd.DataFrame(
+        {
+            "Full Name": ["Dr. Alice", "Dr. Bob", "Dr. Bob", "Dr. Carol"],
+            "Work Address": ["1 Main St, Baltimore, MD", "2 Oak Ave, Towson, MD", "2 Oak Ave, Towson, MD", ""],
+            "Work Phone": ["4105550101", "410-555-0102", "410-555-0102", None],
+            "City": ["Baltimore", None, None, "Columbia"],
+            "Latitude": [39.29, 39.40, 39.40, 39.10],
+            "Longitude": [-76.61, -76.60, -76.60, -76.80],
+            "Referral Count": [10, 4, 4, 1],
+        }
+    )
+    detailed_df = pd.DataFrame(
+        {
+            "Full Name": ["Dr. Alice", "Dr. Bob"],
+            "Work Address": ["1 Main St, Baltimore, MD", "2 Oak Ave, Towson, MD"],
+            "Referral Date": pd.to_datetime(["2024-01-10", "2024-02-10"]),
+        }
+    )
+    inbound_df = pd.DataFrame(
+        {
+            "Full Name": ["Dr. Bob", "Dr. Bob", "Dr. Bob"],
+            "Work Address": ["2 Oak Ave, Towson, MD", "2 Oak Ave, Towson, MD", "9 Elm St, Towson, MD"],
+            "Referral Date": pd.to_datetime(["2024-01-05", "2024-03-01", "2024-04-01"]),
+        }
+    )
+    preferred_df = pd.DataFrame(
+        {
+            "Full Name": ["Dr. Alice", "Dr. Dana"],
+            "Specialty": ["Orthopedics", "Chiropractic"],
+            "Latitude": [39.29, 39.20],
+            "Longitude": [-76.61, -76.70],
+        }
+    )
+
+    monkeypatch.setattr(app_logic, "load_and_validate_provider_data", lambda: provider_df.copy())
+    monkeypatch.setattr(app_logic, "load_detailed_referrals", lambda: detailed_df.copy())
+    monkeypatch.setattr(app_logic, "load_inbound_referrals", lambda: inbound_df.copy())
+    monkeypatch.setattr(ingestion, "load_preferred_providers", lambda: preferred_df.copy())
+    app_logic.load_application_data.clear()
+    yield
+    app_logic.load_application_data.clear()
+
+
+def test_load_application_data_enriches_providers(stub_loaders):
+    """Providers are deduplicated and enriched with inbound counts and preferred flags."""
+    provider_df, detailed_df, inbound_df = app_logic.load_application_data()
+
+    assert not detailed_df.empty
+    assert not inbound_df.empty
+    assert provider_df["Full Name"].is_unique
+    assert list(provider_df.index) == list(provider_df["Full Name"])
+    # Dr. Dana only appears on the preferred list and is appended
+    assert set(provider_df["Full Name"]) == {"Dr. Alice", "Dr. Bob", "Dr. Carol", "Dr. Dana"}
+
+    rows = provider_df.set_index("Full Name", drop=False)
+    assert rows.loc["Dr. Bob", "Inbound Referral Count"] == 3
+    assert rows.loc["Dr. Alice", "Inbound Referral Count"] == 0
+    assert bool(rows.loc["Dr. Alice", "Preferred Provider"]) is True
+    assert bool(rows.loc["Dr. Bob", "Preferred Provider"]) is False
+    assert bool(rows.loc["Dr. Dana", "Preferred Provider"]) is True
+    assert rows.loc["Dr. Dana", "Referral Count"] == 0
+    assert rows.loc["Dr. Alice", "Work Phone Number"] == "(410) 555-0101"
+    assert rows.loc["Dr. Bob", "City"] == ""
+
+
+def test_build_provider_table_blanks_missing_full_address(monkeypatch):
+    """A NaN Full Address is blanked like the "nan"/"<NA>" renderings, not left as NaN."""
+    provider_df = pd.DataFrame(
+        {
+            "Full Name": ["Dr. Alice", "Dr. Bob", "Dr. Carol"],
+            "Full Address": [np.nan, "nan", "1 Main St, Baltimore, MD"],
+            "Latitude": [39.29, 39.40, 39.10],
+            "Longitude": [-76.61, -76.60, -76.80],
+            "Referral Count": [10, 4, 1],
+        }
+    )
+    monkeypatch.setattr(app_logic, "load_and_validate_provider_data", lambda: provider_df.copy())
+    monkeypatch.setattr(ingestion, "load_preferred_providers", lambda: pd.DataFrame())
+    # Keep the rebuild out of the way so the blanking step itself is checked
+    monkeypatch.setattr(app_logic, "build_full_address", lambda df: df)
+
+    result = app_logic._build_provider_table(pd.DataFrame())
+
+    assert list(result["Full Address"]) == ["", "", "1 Main St, Baltimore, MD"]
+
+
+def test_load_application_data_feeds_recommendation(stub_loaders):
+    """The loader output works with time filtering and the recommendation workflow."""
+    provider_df, detailed_df, inbound_df = app_logic.load_application_data()
+
+    filtered = app_logic.apply_time_filtering(provider_df, detailed_df, inbound_df, "2024-01-01", "2024-12-31")
+    best, scored_df = app_logic.run_recommendation(
+        filtered,
+        39.29,
+        -76.61,
+        min_referrals=0,
+        max_radius_miles=50,
+        alpha=0.5,
+        beta=0.3,
+        gamma=0.2,
+    )
+
+    assert best is not None
+    assert best["Full Name"] == "Dr. Alice"
+    assert scored_df["Full Name"].is_unique
+
+
+def test_run_recommendation_cache_keyed_on_data_key(stub_loaders):
+    """Cached recommendations follow the data key, not the content of the frame passed in."""
+    provider_df, _, _ = app_logic.load_application_data()
+    data_version = provider_df.attrs["data_version"]
+    assert data_version == ingestion.get_data_version()
+    kwargs = dict(min_referrals=5, max_radius_miles=50, alpha=0.5, beta=0.3, gamma=0.2)
+    app_logic._run_recommendation_cached.clear()
+
+    best, _ = app_logic.run_recommendation(provider_df, 39.29, -76.61, data_key=(data_version, None), **kwargs)
+    assert best["Full Name"] == "Dr. Alice"
+
+    # Same shape and columns, different counts: Alice now falls below the threshold
+    demoted = provider_df.copy()
+    demoted.loc[demoted["Full Name"] == "Dr. Alice", "Referral Count"] = 0
+
+    # Under the same key the frame is not hashed, so the cached result is served
+    cached_best, _ = app_logic.run_recommendation(demoted, 39.29, -76.61, data_key=(data_version, None), **kwargs)
+    assert cached_best["Full Name"] == "Dr. Alice"
+
+    # A new key (e.g. a time filter) or no key at all recomputes from the frame
+    time_key = (data_version, ("2024-01-01", "2024-12-31"))
+    for key in (time_key, None):
+        demoted_best, demoted_df = app_logic.run_recommendation(demoted, 39.29, -76.61, data_key=key, **kwargs)
+        assert demoted_best is None or demoted_best["Full Name"] != "Dr. Alice"
+        assert "Dr. Alice" not in set(demoted_df.get("Full Name", []))
+    app_logic._run_recommendation_cached.clear()
+
+
+def test_load_application_data_reuses_disk_cache(stub_loaders, tmp_path, monkeypatch):
+    """With local parquet inputs, a cold load reads the enriched table back from disk."""
+    processed = tmp_path / "data" / "processed"
+    processed.mkdir(parents=True)
+    (processed / "cleaned_outbound_referrals.parquet").write_bytes(b"stub")
+
+    provider_df, _, _ = app_logic.load_application_data()
+    assert len(list((tmp_path / "data" / "cache").glob("provider_enriched_*.parquet"))) == 1
+
+    def fail():
+        raise AssertionError("provider pipeline should not rerun on a disk cache hit")
+
+    monkeypatch.setattr(app_logic, "load_and_validate_provider_data", fail)
+    app_logic.load_application_data.clear()
+    cached_df, _, _ = app_logic.load_application_data()
+
+    assert list(cached_df.columns) == list(provider_df.columns)
+    assert list(cached_df.index) == list(provider_df.index)
+    counts = ["Referral Count", "Inbound Referral Count", "Preferred Provider"]
+    pd.testing.assert_frame_equal(cached_df[counts], provider_df[counts])
+    assert isinstance(cached_df["Specialty"].dtype, pd.CategoricalDtype)
+
+
+def test_load_application_data_loads_referrals_concurrently(stub_loaders, monkeypatch):
+    """The outbound and inbound referral loads overlap instead of running back to back."""
+    import threading
+
+    # Each loader blocks until the other has started, so sequential loading would time out
+    barrier = threading.Barrier(2, timeout=5)
+
+    def load_referrals():
+        barrier.wait()
+        return pd.DataFrame({"Full Name": []})
+
+    monkeypatch.setattr(app_logic, "load_detailed_referrals", load_referrals)
+    monkeypatch.setattr(app_logic, "load_inbound_referrals", load_referrals)
+
+    _, detailed_df, inbound_df = app_logic.load_application_data()
+
+    assert detailed_df.empty and inbound_df.empty
@@ -0,0 +1,43 @@
+"""Test suite for phone number formatting helpers.
+
+Tests verify that the vectorized format_phone_series produces the same
+display strings as the scalar format_phone_number for common inputs.
+"""
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.utils.io_utils import format_phone_number, format_phone_series
+
+
+@pytest.mark.parametrize(
+    "values",
+    [
+        ["4105550101", "410-555-0102", "(410) 555-0103", "410.555.0104", "1-410-555-0105"],
+        [4105550101.0, 14105550102.0, np.nan],
+        ["4435140560.0", "", None, "ext 12"],
+    ],
+)
+def test_format_phone_series_matches_scalar(values):
+    """Formatted and missing values match the scalar formatter."""
+    series = pd.Series(values, dtype=object)
+
+    result = format_phone_series(series)
+
+    expected = [format_phone_number(v) for v in values]
+    for got, want in zip(result, expected):
+        if want is None:
+            assert got is None
+        else:
+            assert got == want
+
+
+def test_format_phone_series_preserves_index():
+    """The result aligns with the input index."""
+    series = pd.Series(["4105550101", None], index=["Dr. A", "Dr. B"])
+
+    result = format_phone_series(series)
+
+    assert list(result.index) == ["Dr. A", "Dr. B"]
+    assert result["Dr. A"] == "(410) 555-0101"
+    assert result["Dr. B"] is None
@@ -223,3 +223,43 @@ def test_all_providers_marked_preferred_bug():
     
     # The validation logic should detect this
     assert preferred_pct > 80  # Would trigger warning in actual code
+
+
+def test_merge_preferred_providers_flags_and_appends():
+    """The app_logic helper flags preferred providers and appends preferred-only rows."""
+    from src.app_logic import _merge_preferred_providers
+
+    provider_df = pd.DataFrame({
+        'Full Name': ['Dr. Alice', 'Dr. Bob', 'Dr. Charlie'],
+        'Referral Count': [5, 3, 2]
+    })
+    pref_data = pd.DataFrame({
+        'Full Name': ['Dr. Bob', 'Dr. NewDoctor'],
+        'Specialty': ['Cardiology', 'Orthopedics']
+    })
+
+    result = _merge_preferred_providers(provider_df, pref_data)
+
+    assert len(result) == 4
+    assert result['Preferred Provider'].dtype == bool
+    flags = dict(zip(result['Full Name'], result['Preferred Provider']))
+    assert flags == {'Dr. Alice': False, 'Dr. Bob': True, 'Dr. Charlie': False, 'Dr. NewDoctor': True}
+    assert '_merge' not in result.columns
+    assert 'Specialty_pref' not in result.columns
+
+
+def test_merge_preferred_providers_specialty_priority():
+    """Preferred specialties win; other providers keep their own specialty."""
+    from src.app_logic import _merge_preferred_providers
+
+    provider_df = pd.DataFrame({
+        'Full Name': ['Dr. Alice', 'Dr. Bob'],
+        'Specialty': ['Chiropractic', 'General Practice'],
+        'Referral Count': [5, 3]
+    })
+    pref_data = pd.DataFrame({'Full Name': ['Dr. Bob'], 'Specialty': ['Cardiology']})
+
+    result = _merge_preferred_providers(provider_df, pref_data).set_index('Full Name')
+
+    assert result.loc['Dr. Bob', 'Specialty'] == 'Cardiology'
+    assert result.loc['Dr. Alice', 'Specialty'] == 'Chiropractic'
@@ -3,6 +3,7 @@
 """Tests for S3 data client functionality."""
 
 from datetime import datetime
+from io import BytesIO
 from unittest.mock import MagicMock, patch
 
 import pytest
@@ -115,15 +116,13 @@ class TestS3DataClient:
         # Mock file download
         test_data = b"test file content"
 
-        def mock_download_fileobj(bucket, key, buffer):
-            buffer.write(test_data)
-
-        mock_client.download_fileobj.side_effect = mock_download_fileobj
+        mock_client.get_object.return_value = {"Body": BytesIO(test_data)}
 
         client = S3DataClient(folder_map={})
         result = client.download_file("referrals", "test.csv")
 
         assert result == test_data
+        mock_client.get_object.assert_called_once_with(Bucket="test-bucket", Key="referrals/test.csv")
 
     @patch("boto3.Session")
     @patch("src.utils.config.get_api_config")
@@ -157,10 +156,7 @@ class TestS3DataClient:
         # Mock file download
         test_data = b"latest file content"
 
-        def mock_download_fileobj(bucket, key, buffer):
-            buffer.write(test_data)
-
-        mock_client.download_fileobj.side_effect = mock_download_fileobj
+        mock_client.get_object.return_value = {"Body": BytesIO(test_data)}
 
         client = S3DataClient(folder_map={})
         result = client.download_latest_file("referrals")
@@ -241,3 +237,41 @@ class TestS3DataClient:
         issues = client.validate_configuration()
 
         assert issues == {}
+
+
+def test_failed_download_is_not_cached(monkeypatch):
+    """A download that fails for a listed file is retried on the next call instead of cached."""
+    import src.utils.s3_client_optimized as s3_module
+
+    responses = [{"referrals": None}, {"referrals": (b"data", "latest.csv")}]
+    fake_client = MagicMock()
+    fake_client.is_configured.return_value = True
+    fake_client.download_latest_files_batch.side_effect = lambda folder_types: responses.pop(0)
+    monkeypatch.setattr(s3_module, "get_optimized_s3_client", lambda folder_map_key=None: fake_client)
+    s3_module._download_latest_files_cached.clear()
+    signature = (("referrals", "latest.csv", 1),)
+
+    with pytest.raises(RuntimeError):
+        s3_module._download_latest_files_cached(["referrals"], None, signature)
+    first = s3_module._download_latest_files_cached(["referrals"], None, signature)
+    second = s3_module._download_latest_files_cached(["referrals"], None, signature)
+
+    assert first == second == {"referrals": (b"data", "latest.csv")}
+    assert fake_client.download_latest_files_batch.call_count == 2
+    s3_module._download_latest_files_cached.clear()
+
+
+def test_empty_folder_download_is_not_a_failure(monkeypatch):
+    """A folder the signature lists as empty may come back without a file."""
+    import src.utils.s3_client_optimized as s3_module
+
+    fake_client = MagicMock()
+    fake_client.is_configured.return_value = True
+    fake_client.download_latest_files_batch.return_value = {"referrals": None}
+    monkeypatch.setattr(s3_module, "get_optimized_s3_client", lambda folder_map_key=None: fake_client)
+    s3_module._download_latest_files_cached.clear()
+
+    result = s3_module._download_latest_files_cached(["referrals"], None, (("referrals", "", 0),))
+
+    assert result == {"referrals": None}
+    s3_module._download_latest_files_cached.clear()
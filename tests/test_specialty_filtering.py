@@ -9,7 +9,7 @@ Tests verify that:
 import pandas as pd
 import pytest
 
-from src.app_logic import filter_providers_by_specialty, get_unique_specialties
+from src.app_logic import filter_providers_by_specialty, get_unique_specialties, run_recommendation
 
 
 @pytest.fixture
@@ -227,3 +227,43 @@ def test_filter_preserves_dataframe_structure(sample_provider_data):
     # Should be a copy, not a view
     filtered["Test"] = "value"
     assert "Test" not in sample_provider_data.columns
+
+
+def test_recommendation_combines_specialty_referral_and_radius_filters(sample_provider_data):
+    """Specialty, referral threshold, and radius filters all apply in one recommendation run."""
+    best, scored_df = run_recommendation(
+        sample_provider_data,
+        38.9,
+        -77.0,
+        min_referrals=11,
+        max_radius_miles=6,
+        alpha=0.5,
+        beta=0.5,
+        gamma=0.0,
+        selected_specialties=["Chiropractic", "Physical Therapy"],
+    )
+
+    # Dr. Smith has too few referrals, Dr. Johnson (~8.8 mi) is outside the radius,
+    # and Dr. Brown / Dr. Davis do not match the selected specialties
+    assert best["Full Name"] == "Dr. Jones"
+    assert set(scored_df["Full Name"]) == {"Dr. Jones"}
+    assert scored_df["Distance (Miles)"].iloc[0] < 6
+
+
+def test_filter_uses_precomputed_specialty_sets(sample_provider_data):
+    """Test that a precomputed _specialty_set column gives the same results as splitting strings."""
+    with_sets = sample_provider_data.copy()
+    with_sets["_specialty_set"] = [
+        frozenset({"Chiropractic"}),
+        frozenset({"Physical Therapy"}),
+        frozenset({"Chiropractic", "Physical Therapy"}),
+        frozenset({"Neurology"}),
+        frozenset(),
+        frozenset({"Chiropractic/Physical Therapy"}),
+    ]
+
+    for selected in (["Chiropractic"], ["Neurology", "Physical Therapy"], ["Unknown"]):
+        expected = filter_providers_by_specialty(sample_provider_data, selected)["Full Name"].tolist()
+        assert filter_providers_by_specialty(with_sets, selected)["Full Name"].tolist() == expected
+
+    assert get_unique_specialties(with_sets) == get_unique_specialties(sample_provider_data)
@@ -0,0 +1,74 @@
+"""Test suite for time-window referral count filtering.
+
+Tests verify that apply_time_filtering replaces full-history referral counts
+with counts from the selected date range, without duplicating providers.
+"""
+import pandas as pd
+import pytest
+
+from src.app_logic import apply_time_filtering
+
+
+@pytest.fixture
+def provider_df():
+    return pd.DataFrame(
+        {
+            "Full Name": ["Dr. Alice", "Dr. Bob", "Dr. Carol"],
+            "Referral Count": [10, 5, 2],
+            "Inbound Referral Count": [3, 1, 0],
+        }
+    )
+
+
+@pytest.fixture
+def detailed_referrals_df():
+    return pd.DataFrame(
+        {
+            "Full Name": ["Dr. Alice", "Dr. Alice", "Dr. Alice", "Dr. Bob"],
+            "Work Address": ["1 Main St", "1 Main St", "2 Side St", "3 Oak Ave"],
+            "Referral Date": pd.to_datetime(["2024-01-10", "2024-02-10", "2024-02-20", "2023-06-01"]),
+        }
+    )
+
+
+@pytest.fixture
+def inbound_referrals_df():
+    return pd.DataFrame(
+        {
+            "Full Name": ["Dr. Bob", "Dr. Bob", "Dr. Carol"],
+            "Referral Date": pd.to_datetime(["2024-01-05", "2024-03-01", "2022-01-01"]),
+        }
+    )
+
+
+def test_time_filtering_replaces_counts(provider_df, detailed_referrals_df, inbound_referrals_df):
+    """Counts are recomputed for the window; providers outside it drop to zero."""
+    result = apply_time_filtering(
+        provider_df, detailed_referrals_df, inbound_referrals_df, "2024-01-01", "2024-12-31"
+    )
+
+    counts = result.set_index("Full Name")
+    # Alice's referrals span two addresses; both are summed into one provider row
+    assert counts.loc["Dr. Alice", "Referral Count"] == 3
+    assert counts.loc["Dr. Bob", "Referral Count"] == 0
+    assert counts.loc["Dr. Carol", "Referral Count"] == 0
+    assert counts.loc["Dr. Bob", "Inbound Referral Count"] == 2
+    assert counts.loc["Dr. Carol", "Inbound Referral Count"] == 0
+
+
+def test_time_filtering_preserves_row_count(provider_df, detailed_referrals_df, inbound_referrals_df):
+    """Time filtering never duplicates or drops provider rows."""
+    result = apply_time_filtering(
+        provider_df, detailed_referrals_df, inbound_referrals_df, "2024-01-01", "2024-12-31"
+    )
+
+    assert len(result) == len(provider_df)
+    assert list(result["Full Name"]) == list(provider_df["Full Name"])
+
+
+def test_time_filtering_empty_window_keeps_counts(provider_df, detailed_referrals_df):
+    """When no referrals fall in the window the existing counts are left untouched."""
+    result = apply_time_filtering(provider_df, detailed_referrals_df, pd.DataFrame(), "2030-01-01", "2030-12-31")
+
+    assert list(result["Referral Count"]) == [10, 5, 2]
+    assert list(result["Inbound Referral Count"]) == [3, 1, 0]